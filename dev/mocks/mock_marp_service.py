@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import lru_cache
 
 from src.protocols.schemas import OutputFormat
 
@@ -11,13 +12,18 @@ logging.basicConfig(
 class MockMarpService:
     OutputFormat = OutputFormat
 
-    def __init__(self, slides_path, output_dir=None):
+    def __init__(self, slides_path=None, output_dir=None):
         self.slides_path = slides_path
         self.output_dir = output_dir
         self.logger = logging.getLogger(__name__)
         if self.output_dir:
             os.makedirs(self.output_dir, exist_ok=True)
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def output_filename(name, output_type):
+        return f"{name}.{output_type.value}"
+
     def generate_pdf(self, output_filename="slides.pdf", theme=None):
         return self._mock_generate(self.OutputFormat.PDF, output_filename, theme=theme)
 
@@ -30,6 +36,33 @@ class MockMarpService:
     def generate_pptx(self, output_filename="slides.pptx", theme=None):
         return self._mock_generate(self.OutputFormat.PPTX, output_filename, theme=theme)
 
+    def convert_markdown(
+        self, markdown, output_type, theme=None, out_stream=None, use_marp=True
+    ):
+        content = f"Mock {output_type.value} file generated from Markdown"
+        if theme:
+            content += f" with theme: {theme}"
+        self.logger.info(f"MOCK {output_type.value.upper()} generation successful")
+        if out_stream is not None:
+            out_stream.write(content.encode("utf-8"))
+            return None
+        return content.encode("utf-8")
+
+    def generate_batch(self, slides_paths, output_type, theme=None, parallel=None):
+        output_paths = []
+        for slides_path in slides_paths:
+            stem = os.path.splitext(os.path.basename(slides_path))[0]
+            mock_service = MockMarpService(slides_path, self.output_dir)
+            output_paths.append(
+                mock_service._mock_generate(
+                    output_type, self.output_filename(stem, output_type), theme=theme
+                )
+            )
+        return output_paths
+
+    def generate_parallel(self, slides_paths, output_type, theme=None, workers=5):
+        return self.generate_batch(slides_paths, output_type, theme=theme)
+
     def _mock_generate(self, output_type, output_filename, theme=None):
         if not self.output_dir:
             raise ValueError("Output directory must be set for generation.")
@@ -0,0 +1,33 @@
+"""
+Precompute _meta.json sidecars for the slide template packages.
+
+SlidesLoader reads a template's sidecar instead of introspecting its slide
+functions at runtime, and ignores it once the template's sources change.
+
+Usage:
+    PYTHONPATH=. python scripts/build_template_meta.py
+"""
+
+import json
+from pathlib import Path
+
+from src.backend.services.slides_loader import META_FILENAME, SlidesLoader
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "src" / "backend" / "templates"
+
+
+def main() -> None:
+    loader = SlidesLoader()
+    for template_dir in sorted(TEMPLATES_DIR.iterdir()):
+        if not (template_dir / "__init__.py").exists():
+            continue
+
+        meta = loader.build_template_meta(template_dir.name)
+        (template_dir / META_FILENAME).write_text(
+            json.dumps(meta, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+        print(f"✅ {template_dir.name}: {len(meta['functions'])} functions")
+
+
+if __name__ == "__main__":
+    main()
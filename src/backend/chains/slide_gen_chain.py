@@ -1,5 +1,8 @@
+import asyncio
 import inspect
-from typing import Callable, Dict, Optional
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
 
 import streamlit as st
 from langchain_core.output_parsers import StrOutputParser
@@ -15,6 +18,41 @@ from src.backend.models.slide_template import SlideTemplate
 from src.backend.services import JsonParser, PromptService, SlidesLoader
 from src.protocols.slide_generation_protocol import SlideGenerationProtocol
 
+# Event loop reused by the synchronous entry point, one per thread
+_thread_state = threading.local()
+
+
+def _close_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Shut down a thread's event loop: async generators, executor, then loop"""
+    if loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+
+class _ThreadEventLoop:
+    """Holds one thread's event loop and closes it when the thread exits
+
+    The holder lives only in the thread-local state, which is released when its
+    thread finishes (Streamlit uses a new script thread per rerun), so the
+    finalizer then closes the loop; it also runs at interpreter exit.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        weakref.finalize(self, _close_event_loop, self.loop)
+
+
+def _get_thread_event_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's cached event loop, creating it on first use"""
+    holder = getattr(_thread_state, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _thread_state.holder = _ThreadEventLoop()
+    return holder.loop
+
 
 class SlideGenChain(SlideGenerationProtocol):
     """LangChain LCEL chains for slide generation workflow"""
@@ -40,7 +78,21 @@ class SlideGenChain(SlideGenerationProtocol):
         self.progress_callback = progress_callback
         self.current_phase = 0
         self.total_phases = 3  # analyzing, composing, building
-        self._setup_chains()
+        # Built on first use; see the slide_gen_chain property
+        self._slide_gen_chain = None
+
+    @property
+    def slide_gen_chain(self):
+        """Unified LCEL chain, assembled on first access
+
+        The runnables close over this instance (client, progress callback), so the
+        graph can't be shared between instances; deferring it means instances that
+        never run, like the app-level generator the result page re-creates with a
+        progress callback, don't pay for it.
+        """
+        if self._slide_gen_chain is None:
+            self._slide_gen_chain = self._setup_chains()
+        return self._slide_gen_chain
 
     def _setup_client(self) -> OlmClientV1Protocol:
         """Setup olm-api SDK client based on configuration"""
@@ -81,9 +133,9 @@ class SlideGenChain(SlideGenerationProtocol):
         return (
             RunnablePassthrough.assign(prompt=RunnableLambda(prompt_builder_method))
             | RunnableLambda(lambda x: x["prompt"])
+            # The LLM call only reads "prompt", so don't copy the rest of the dict
             | RunnableLambda(
                 lambda prompt_dict: {
-                    **prompt_dict,
                     "prompt": self.prompt_service._truncate_prompt(
                         prompt_dict["prompt"]
                     ),
@@ -97,9 +149,9 @@ class SlideGenChain(SlideGenerationProtocol):
         return (
             RunnablePassthrough.assign(prompt=RunnableLambda(prompt_builder_method))
             | RunnableLambda(lambda x: x["prompt"])
+            # The LLM call only reads "prompt", so don't copy the rest of the dict
             | RunnableLambda(
                 lambda prompt_dict: {
-                    **prompt_dict,
                     "prompt": self.prompt_service._truncate_prompt(
                         prompt_dict["prompt"]
                     ),
@@ -110,12 +162,14 @@ class SlideGenChain(SlideGenerationProtocol):
 
     def _setup_chains(self):
         """Setup unified slide generation chain with placeholder approach"""
-        self.slide_gen_chain = (
+        return (
             # Phase 1: Analysis
             RunnablePassthrough.assign(
                 analysis_result=self._create_chain_step(
                     self.prompt_service.build_analysis_prompt
                 )
+                # Serialize once; every later prompt embeds the same JSON string
+                | RunnableLambda(self.prompt_service._dump_analysis_result)
             )
             # Phase 2: Composition
             | RunnablePassthrough.assign(
@@ -174,6 +228,66 @@ class SlideGenChain(SlideGenerationProtocol):
             )
             raise e
 
+    def invoke_slide_gen_chain_sync(
+        self, script_content: str, template: SlideTemplate
+    ) -> str:
+        """Run invoke_slide_gen_chain from synchronous code (e.g. Streamlit pages)
+
+        Unlike asyncio.run, the thread's event loop is kept and reused across calls
+        and shut down when the thread exits.
+        """
+        return _get_thread_event_loop().run_until_complete(
+            self.invoke_slide_gen_chain(script_content, template)
+        )
+
+    async def invoke_slide_gen_chain_batch(
+        self, jobs: List[Tuple[str, SlideTemplate]]
+    ) -> List[str]:
+        """
+        Run independent slide generations concurrently.
+
+        Keeping several requests in flight lets the LLM server batch them.
+        Jobs are started shortest template duration first (a proxy for output
+        length), so requests in flight together finish at about the same time
+        instead of waiting on one long generation. LLM_MAX_CONCURRENCY in
+        secrets bounds how many run at once.
+
+        Each job runs on its own chain sharing this client, since phase
+        progress is per generation; the progress callback instead receives
+        ("generating", completed jobs, total jobs) as jobs finish.
+
+        Args:
+            jobs: (script_content, template) pairs to generate
+
+        Returns:
+            Generated markdown for each job, in the same order as jobs
+        """
+        max_concurrency = int(st.secrets.get("LLM_MAX_CONCURRENCY", 4))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        completed = 0
+
+        async def run_job(script_content: str, template: SlideTemplate) -> str:
+            nonlocal completed
+            async with semaphore:
+                job_chain = type(self)(client=self.client)
+                result = await job_chain.invoke_slide_gen_chain(
+                    script_content, template
+                )
+            completed += 1
+            self._notify_progress("generating", completed, len(jobs))
+            return result
+
+        # Tasks acquire the semaphore in creation order, so dispatch follows
+        # the sorted order while the semaphore alone bounds concurrency
+        order = sorted(range(len(jobs)), key=lambda i: jobs[i][1].duration_minutes)
+        sorted_results = await asyncio.gather(*(run_job(*jobs[i]) for i in order))
+
+        results: List[str] = [""] * len(jobs)
+        for i, result in zip(order, sorted_results):
+            results[i] = result
+        return results
+
     def _build_template_with_placeholders(self, context: Dict) -> str:
         """Build unified template by calling slide functions with placeholders"""
         print("🏗️ Agent: Building template with placeholders...")
@@ -197,13 +311,11 @@ class SlideGenChain(SlideGenerationProtocol):
                 continue
 
             # Create placeholder parameters based on function signature
-            sig = inspect.signature(func)
-            placeholder_params = {}
-
-            for param_name in sig.parameters.keys():
-                placeholder_params[param_name] = (
-                    f"{{{{{slide_name.upper()}_{i}_{param_name.upper()}}}}}"
-                )
+            prefix = f"{slide_name.upper()}_{i}_"
+            placeholder_params = {
+                param_name: f"{{{{{prefix}{param_name.upper()}}}}}"
+                for param_name in inspect.signature(func).parameters
+            }
 
             # Call the actual slide function with placeholders
             try:
@@ -257,9 +369,13 @@ class SlideGenChain(SlideGenerationProtocol):
         """Report phase completion progress"""
         self.current_phase += 1
         print(f"✅ Phase {self.current_phase}/{self.total_phases} completed: {stage}")
+        self._notify_progress(stage, self.current_phase, self.total_phases)
+
+    def _notify_progress(self, stage: str, current: int, total: int):
+        """Pass progress to the callback, if any, without failing the chain"""
         if self.progress_callback:
             try:
-                self.progress_callback(stage, self.current_phase, self.total_phases)
+                self.progress_callback(stage, current, total)
             except Exception as callback_error:
                 print(f"⚠️ Progress callback error: {callback_error}")
                 # コールバックエラーでもチェーン処理は継続
@@ -1,16 +1,42 @@
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, Optional, Set, Tuple
 
+# Matches ${placeholder} variables in template content
+PLACEHOLDER_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
-@dataclass
+
+def find_placeholders(content: str) -> Set[str]:
+    """Collect ${placeholder} names with str.find; same matches as PLACEHOLDER_PATTERN
+
+    Two C-level finds per placeholder beat the regex engine on template-sized
+    content, and content without "${" costs a single scan.
+    """
+    names = set()
+    find = content.find
+    start = find("${")
+    while start >= 0:
+        end = find("}", start + 2)
+        if end < 0:
+            break
+        if end > start + 2:
+            names.add(content[start + 2 : end])
+        start = find("${", end + 1)
+    return names
+
+
+@dataclass(slots=True)
 class SlideTemplate:
     id: str
     name: str
     description: str
     template_dir: Path
     duration_minutes: int
+    # (st_mtime_ns, content) of slides.py as last read by slides_source
+    _slides_source: Optional[Tuple[int, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def slides_path(self) -> Path:
@@ -33,6 +59,19 @@ class SlideTemplate:
             raise FileNotFoundError(f"Slides file not found: {self.slides_path}")
         return self.slides_path.read_text(encoding="utf-8")
 
+    @property
+    def slides_source(self) -> str:
+        """Slides content, cached on this instance until slides.py is modified"""
+        try:
+            mtime_ns = self.slides_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Slides file not found: {self.slides_path}"
+            ) from None
+        if self._slides_source is None or self._slides_source[0] != mtime_ns:
+            self._slides_source = (mtime_ns, self.read_slides_content())
+        return self._slides_source[1]
+
     def read_css_content(self) -> str:
         """Read CSS theme file"""
         if not self.css_path.exists():
@@ -42,16 +81,16 @@ class SlideTemplate:
     def extract_placeholders(self, template_content: str = None) -> Set[str]:
         """Extract all ${placeholder} variables from template content"""
         if template_content is None:
-            template_content = self.read_slides_content()
-
-        pattern = r"\$\{([^}]+)\}"
-        matches = re.findall(pattern, template_content)
-        return set(matches)
+            template_content = self.slides_source
+        return find_placeholders(template_content)
 
     def render_template(self, template_content: str, variables: Dict[str, str]) -> str:
         """Render template content by replacing placeholders with variables"""
-        result = template_content
-        for key, value in variables.items():
-            placeholder = f"${{{key}}}"
-            result = result.replace(placeholder, value)
-        return result
+        if "${" not in template_content:
+            return template_content
+
+        # Single pass over the content; unknown placeholders are left as-is
+        return PLACEHOLDER_PATTERN.sub(
+            lambda match: variables.get(match.group(1), match.group(0)),
+            template_content,
+        )
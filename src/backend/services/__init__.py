@@ -1,11 +1,12 @@
 from .json_parser import JsonParser
-from .marp_service import MarpService
+from .marp_service import MarpServer, MarpService
 from .prompt_service import PromptService
 from .script_analyzer import ScriptAnalyzer
 from .slides_loader import SlidesLoader
 
 __all__ = [
     "JsonParser",
+    "MarpServer",
     "MarpService",
     "PromptService",
     "ScriptAnalyzer",
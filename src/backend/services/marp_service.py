@@ -1,6 +1,21 @@
+import hashlib
 import logging
 import os
+import shutil
+import socket
 import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import markdown as markdown_lib
 
 from src.protocols.schemas import OutputFormat
 
@@ -10,16 +25,104 @@ logging.basicConfig(
 )
 
 
+# Marp CLI flags selecting the output format when it cannot be inferred from
+# an output file name, i.e. for directories and stdout (HTML is Marp's default; "--html" would instead enable raw HTML in Markdown)
+BATCH_FORMAT_FLAGS = {
+    OutputFormat.PDF: ["--pdf"],
+    OutputFormat.HTML: [],
+    OutputFormat.PNG: ["--image", "png"],
+    OutputFormat.PPTX: ["--pptx"],
+}
+
+# Chunk size used when copying Marp's stdout into a caller's stream
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Query strings selecting the output format from `marp --server`
+# (no query returns the rendered HTML)
+SERVER_FORMAT_QUERIES = {
+    OutputFormat.PDF: "?pdf",
+    OutputFormat.HTML: "",
+    OutputFormat.PNG: "?png",
+    OutputFormat.PPTX: "?pptx",
+}
+
+# Python-Markdown extensions covering the syntax used in slide templates
+MARKDOWN_EXTENSIONS = ["fenced_code", "tables"]
+
+
+def _markdown_to_html(text):
+    """Convert Markdown with raw HTML escaped, like Marp's default html: false"""
+    # Markdown instances are stateful, so build one per call for thread safety
+    md = markdown_lib.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    md.preprocessors.deregister("html_block")
+    md.inlinePatterns.deregister("html")
+    return md.convert(text)
+
+
+def render_html(markdown, css=None):
+    """Render slide Markdown to standalone HTML in-process, without Marp.
+
+    The front matter is dropped and every `---` separated slide becomes a
+    <section>. Marp directives and theme features are not applied, so this is
+    a fast approximation of Marp's HTML output rather than a replacement.
+    Raw HTML in the Markdown is escaped, matching Marp's default.
+    """
+    lines = markdown.splitlines()
+    stripped_lines = [line.strip() for line in lines]
+    # Drop the YAML front matter (marp, theme, paginate, ...)
+    if stripped_lines[:1] == ["---"] and "---" in stripped_lines[1:]:
+        lines = lines[stripped_lines.index("---", 1) + 1 :]
+
+    slides, current, fence = [], [], None
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith(("```", "~~~")):
+            if fence is None:
+                fence = stripped[:3]
+            elif stripped.startswith(fence):
+                fence = None
+        if stripped == "---" and fence is None:
+            slides.append(current)
+            current = []
+        else:
+            current.append(line)
+    slides.append(current)
+
+    bodies = ["\n".join(slide) for slide in slides]
+    sections = "\n".join(
+        "<section>\n" + _markdown_to_html(body) + "\n</section>"
+        for body in bodies
+        if body.strip()
+    )
+    style = f"<style>\n{css}\n</style>\n" if css else ""
+    return (
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        f"{style}</head>\n<body>\n{sections}\n</body>\n</html>\n"
+    )
+
+
 class MarpService:
     OutputFormat = OutputFormat
 
-    def __init__(self, slides_path, output_dir=None):
+    # Upper bound of output bytes kept in memory by convert_markdown; the
+    # service lives in Streamlit session state, so this is per session
+    MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, slides_path=None, output_dir=None):
         self.slides_path = slides_path
         self.output_dir = output_dir
         self.logger = logging.getLogger(__name__)
+        self._conversion_cache = OrderedDict()
+        self._conversion_cache_bytes = 0
         if self.output_dir:
             os.makedirs(self.output_dir, exist_ok=True)
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def output_filename(name, output_type):
+        """Return the output file name <name>.<format>"""
+        return f"{name}.{output_type.value}"
+
     def generate_pdf(self, output_filename="slides.pdf", theme=None):
         return self._generate(self.OutputFormat.PDF, output_filename, theme=theme)
 
@@ -32,6 +135,168 @@ class MarpService:
     def generate_pptx(self, output_filename="slides.pptx", theme=None):
         return self._generate(self.OutputFormat.PPTX, output_filename, theme=theme)
 
+    def convert_markdown(
+        self, markdown, output_type, theme=None, out_stream=None, use_marp=True
+    ):
+        """Convert Markdown text and return the output bytes.
+
+        The Markdown is piped to Marp CLI's stdin and the result read back from
+        stdout, so no slide or output file touches the disk. Results are kept in
+        an LRU cache bounded by MAX_CACHE_BYTES, so converting unchanged Markdown
+        again skips Marp entirely. A theme CSS file is keyed by its modification
+        time, so editing it invalidates the cached output.
+
+        If out_stream is given, the output is copied into it in chunks instead
+        of being returned, so large PDF/PPTX exports are never held in memory
+        as a whole; uncached streamed output is not added to the cache.
+
+        With use_marp=False, HTML is rendered in-process by render_html (theme,
+        if a CSS file path, is inlined) and no subprocess is started.
+        """
+        if not use_marp:
+            if output_type != OutputFormat.HTML:
+                raise ValueError("Only HTML can be rendered without Marp.")
+            css = None
+            if theme and os.path.isfile(theme):
+                css = Path(theme).read_text(encoding="utf-8")
+            data = render_html(markdown, css).encode("utf-8")
+            if out_stream is None:
+                return data
+            out_stream.write(data)
+            return None
+
+        # Encode once; the bytes feed both the cache key and Marp's stdin
+        markdown_bytes = markdown.encode("utf-8")
+        theme_version = ""
+        if theme and os.path.isfile(theme):
+            theme_version = str(os.stat(theme).st_mtime_ns)
+        digest = hashlib.blake2b(markdown_bytes, digest_size=16)
+        digest.update(
+            f"\0{theme or ''}\0{theme_version}\0{output_type.value}".encode("utf-8")
+        )
+        key = digest.digest()
+        if key in self._conversion_cache:
+            self._conversion_cache.move_to_end(key)
+            if out_stream is None:
+                return self._conversion_cache[key]
+            out_stream.write(self._conversion_cache[key])
+            return None
+
+        command = ["marp", "-o", "-"]
+        command.extend(BATCH_FORMAT_FLAGS[output_type])
+        if theme:
+            command.extend(["--theme", theme])
+        if out_stream is not None:
+            self._stream(command, markdown_bytes, output_type, out_stream)
+            return None
+        try:
+            result = subprocess.run(
+                command,
+                input=markdown_bytes,
+                check=True,
+                capture_output=True,
+            )
+            self.logger.info(f"{output_type.value.upper()} generation successful")
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"{output_type.value.upper()} generation failed")
+            self.logger.error(e.stderr)
+            raise e
+
+        self._cache_conversion(key, result.stdout)
+        return result.stdout
+
+    def _cache_conversion(self, key, data):
+        if len(data) > self.MAX_CACHE_BYTES:
+            return
+        self._conversion_cache[key] = data
+        self._conversion_cache_bytes += len(data)
+        while self._conversion_cache_bytes > self.MAX_CACHE_BYTES:
+            _, evicted = self._conversion_cache.popitem(last=False)
+            self._conversion_cache_bytes -= len(evicted)
+
+    def _stream(self, command, markdown_bytes, output_type, out_stream):
+        # Marp reads all of stdin before writing, and its stderr is a few log
+        # lines, so feeding stdin first and then draining stdout cannot block
+        with subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ) as process:
+            try:
+                process.stdin.write(markdown_bytes)
+                process.stdin.close()
+                shutil.copyfileobj(process.stdout, out_stream, STREAM_CHUNK_SIZE)
+                stderr = process.stderr.read()
+            except BaseException:
+                # e.g. the consumer of out_stream went away; leaving the with
+                # block then closes the pipes and reaps the killed child
+                process.kill()
+                raise
+            returncode = process.wait()
+        if returncode:
+            self.logger.error(f"{output_type.value.upper()} generation failed")
+            self.logger.error(stderr)
+            raise subprocess.CalledProcessError(returncode, command, stderr=stderr)
+        self.logger.info(f"{output_type.value.upper()} generation successful")
+
+    def generate_batch(self, slides_paths, output_type, theme=None, parallel=None):
+        """Convert several slide files with a single Marp CLI invocation.
+
+        Node.js/Chromium startup dominates a conversion, so the files are staged
+        into one directory and converted together with --input-dir. Outputs are
+        written to output_dir as <stem>.<format>, in the order of slides_paths.
+        parallel is passed to Marp CLI's --parallel to convert files concurrently.
+        """
+        if not self.output_dir:
+            raise ValueError("Output directory must be set for generation.")
+        stems = [Path(slides_path).stem for slides_path in slides_paths]
+        if len(set(stems)) != len(stems):
+            raise ValueError("Batch slide files must have unique file names.")
+
+        with tempfile.TemporaryDirectory(prefix="marp-batch-") as input_dir:
+            for slides_path, stem in zip(slides_paths, stems):
+                shutil.copyfile(slides_path, os.path.join(input_dir, f"{stem}.md"))
+
+            command = ["marp", "--input-dir", input_dir, "-o", self.output_dir]
+            command.extend(BATCH_FORMAT_FLAGS[output_type])
+            if theme:
+                command.extend(["--theme", theme])
+            if parallel:
+                command.extend(["--parallel", str(parallel)])
+            self._run(command, output_type, self.output_dir)
+
+        return [
+            os.path.join(self.output_dir, self.output_filename(stem, output_type))
+            for stem in stems
+        ]
+
+    def generate_parallel(self, slides_paths, output_type, theme=None, workers=5):
+        """Convert several slide files with one Marp CLI process per file.
+
+        Each conversion blocks in subprocess.run, which releases the GIL, so a
+        thread pool runs up to `workers` conversions at once. Outputs are written
+        to output_dir as <stem>.<format> and returned in the order of slides_paths.
+        """
+        if not self.output_dir:
+            raise ValueError("Output directory must be set for generation.")
+        stems = [Path(slides_path).stem for slides_path in slides_paths]
+        if len(set(stems)) != len(stems):
+            raise ValueError("Batch slide files must have unique file names.")
+
+        def convert(slides_path, stem):
+            output_path = os.path.join(
+                self.output_dir, self.output_filename(stem, output_type)
+            )
+            command = ["marp", slides_path, "-o", output_path]
+            if theme:
+                command.extend(["--theme", theme])
+            self._run(command, output_type, output_path)
+            return output_path
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(convert, slides_paths, stems))
+
     def _generate(self, output_type, output_filename, theme=None):
         if not self.output_dir:
             raise ValueError("Output directory must be set for generation.")
@@ -39,6 +304,10 @@ class MarpService:
         command = ["marp", self.slides_path, "-o", output_path]
         if theme:
             command.extend(["--theme", theme])
+        self._run(command, output_type, output_path)
+        return output_path
+
+    def _run(self, command, output_type, output_path):
         try:
             result = subprocess.run(
                 command,
@@ -50,7 +319,6 @@ class MarpService:
                 f"{output_type.value.upper()} generation successful: {output_path}"
             )
             self.logger.debug(result.stdout)
-            return output_path
         except subprocess.CalledProcessError as e:
             self.logger.error(f"{output_type.value.upper()} generation failed")
             self.logger.error(e.stderr)
@@ -72,3 +340,118 @@ class MarpService:
             raise e
         except KeyboardInterrupt:
             self.logger.info("\nStopping Marp preview server.")
+
+
+def _find_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _stop_process(process):
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+class MarpServer:
+    """Long-lived `marp --server` process converting slides over HTTP.
+
+    Node.js/Chromium start once in __init__ instead of once per conversion.
+    Slide files are staged into the served directory (one reused file per
+    source) and fetched with the query string of the requested format. Without
+    a port, a free one is picked so an unrelated local server is never used.
+    Call close() (or use it as a context manager) to stop the server.
+    """
+
+    def __init__(self, port=None, startup_timeout=30.0, request_timeout=120.0):
+        self.port = port or _find_free_port()
+        self.request_timeout = request_timeout
+        self.logger = logging.getLogger(__name__)
+        self._input_dir = tempfile.TemporaryDirectory(prefix="marp-server-")
+        # slides_path -> (staged file name, lock); each source keeps one staged
+        # file for the server's lifetime instead of creating and unlinking one
+        # per conversion
+        self._staged = {}
+        self._staged_lock = threading.Lock()
+        self._process = subprocess.Popen(
+            ["marp", "--server", self._input_dir.name],
+            env={**os.environ, "PORT": str(self.port)},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        # Stop the server once per service, on close() or when the server is
+        # garbage collected / the interpreter exits, whichever comes first
+        self._finalizer = weakref.finalize(self, _stop_process, self._process)
+        try:
+            self._wait_until_ready(startup_timeout)
+        except Exception:
+            self.close()
+            raise
+
+    def convert(self, slides_path, output_path, output_type):
+        name, lock = self._acquire_staged(slides_path)
+        url = f"{self._url}/{name}{SERVER_FORMAT_QUERIES[output_type]}"
+        # The staged file is rewritten in place, so hold its lock until the
+        # server has rendered it
+        with lock:
+            shutil.copyfile(slides_path, os.path.join(self._input_dir.name, name))
+            try:
+                with urllib.request.urlopen(
+                    url, timeout=self.request_timeout
+                ) as response:
+                    data = response.read()
+            except OSError as e:
+                self.logger.error(f"{output_type.value.upper()} generation failed")
+                self.logger.error(e)
+                raise e
+
+        with open(output_path, "wb") as f:
+            f.write(data)
+        self.logger.info(
+            f"{output_type.value.upper()} generation successful: {output_path}"
+        )
+        return output_path
+
+    def close(self):
+        self._finalizer()
+        self._input_dir.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _acquire_staged(self, slides_path):
+        with self._staged_lock:
+            if slides_path not in self._staged:
+                self._staged[slides_path] = (
+                    f"{uuid.uuid4().hex}.md",
+                    threading.Lock(),
+                )
+            return self._staged[slides_path]
+
+    @property
+    def _url(self):
+        return f"http://localhost:{self.port}"
+
+    def _wait_until_ready(self, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError("Marp server exited during startup.")
+            try:
+                with urllib.request.urlopen(self._url, timeout=1):
+                    pass
+            except OSError:
+                time.sleep(0.2)
+                continue
+            # A response only counts if our child is still the one serving
+            if self._process.poll() is not None:
+                raise RuntimeError("Marp server exited during startup.")
+            return
+        raise TimeoutError(f"Marp server did not start within {timeout} seconds.")
@@ -1,7 +1,8 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 from string import Template
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import streamlit as st
 
@@ -9,8 +10,12 @@ import streamlit as st
 class PromptService:
     """Service for building and managing prompts from templates"""
 
+    __slots__ = ("template_dir", "_template_cache")
+
     def __init__(self, template_dir: str = "src/backend/static/prompts"):
         self.template_dir = Path(template_dir)
+        # Parsed templates keyed by path: (mtime, template, is_static)
+        self._template_cache: Dict[Path, Tuple[int, Template, bool]] = {}
 
     def _truncate_prompt(self, prompt: str) -> str:
         """
@@ -39,10 +44,50 @@ class PromptService:
 
         return truncated_prompt
 
+    def _load_template(self, template_name: str) -> Tuple[Template, bool]:
+        """Load a prompt template, re-reading the file only when it has changed.
+
+        Returns the template and whether it is static (contains no "$"),
+        computed once per file version rather than on every build.
+        """
+        prompt_file = self.template_dir / template_name
+        mtime = prompt_file.stat().st_mtime_ns
+
+        cached = self._template_cache.get(prompt_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        # Binary read + one decode: no TextIOWrapper or newline translation
+        content = prompt_file.read_bytes().decode("utf-8")
+        prompt_template = Template(content)
+        is_static = "$" not in content
+        self._template_cache[prompt_file] = (mtime, prompt_template, is_static)
+        return prompt_template, is_static
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _format_arguments_list(args_info: Tuple[Tuple[str, str], ...]) -> str:
+        """Format function arguments as a bullet list, memoized per argument set."""
+        return "\n".join(f"  - {name}: {desc}" for name, desc in args_info)
+
+    @staticmethod
+    def _dump_analysis_result(analysis_result: Any) -> str:
+        """Serialize analysis_result to JSON unless it is already a JSON string.
+
+        SlideGenChain serializes the analysis once when it is produced, so every
+        build_*_prompt in a run embeds that string without re-encoding it.
+        """
+        if isinstance(analysis_result, str):
+            # Already serialized upstream
+            return analysis_result
+        return json.dumps(analysis_result, ensure_ascii=False)
+
     def _build_prompt(self, template_name: str, substitutions: Dict[str, Any]) -> str:
         """Build a prompt from a template file and substitutions."""
-        prompt_file = self.template_dir / template_name
-        prompt_template = Template(prompt_file.read_text(encoding="utf-8"))
+        prompt_template, is_static = self._load_template(template_name)
+        if is_static:
+            # Static prompt: nothing to substitute
+            return prompt_template.template
         return prompt_template.substitute(substitutions)
 
     def build_analysis_prompt(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -63,8 +108,8 @@ class PromptService:
         target_slide_count = st.secrets.get("TARGET_SLIDE_COUNT", 10)
         substitutions = {
             "script_content": input_dict["script_content"],
-            "analysis_result": json.dumps(
-                input_dict["analysis_result"], ensure_ascii=False
+            "analysis_result": self._dump_analysis_result(
+                input_dict["analysis_result"]
             ),
             "slide_functions_summary": input_dict["slide_functions_summary"],
             "target_slide_count": str(target_slide_count),
@@ -77,8 +122,8 @@ class PromptService:
         function_info = input_dict["function_info"]
         substitutions = {
             "script_content": input_dict["script_content"],
-            "analysis_result": json.dumps(
-                input_dict["analysis_result"], ensure_ascii=False
+            "analysis_result": self._dump_analysis_result(
+                input_dict["analysis_result"]
             ),
             "slide_name": input_dict["slide_name"],
             "function_purpose": (
@@ -87,11 +132,8 @@ class PromptService:
                 else ""
             ),
             "function_signature": function_info.get("signature", ""),
-            "arguments_list": "\n".join(
-                [
-                    f"  - {name}: {desc}"
-                    for name, desc in function_info.get("args_info", {}).items()
-                ]
+            "arguments_list": self._format_arguments_list(
+                tuple(function_info.get("args_info", {}).items())
             ),
         }
         prompt = self._build_prompt("generate_parameters.md", substitutions)
@@ -101,8 +143,8 @@ class PromptService:
         """Build placeholder filling prompt"""
         substitutions = {
             "script_content": input_dict["script_content"],
-            "analysis_result": json.dumps(
-                input_dict["analysis_result"], ensure_ascii=False
+            "analysis_result": self._dump_analysis_result(
+                input_dict["analysis_result"]
             ),
             "template_with_placeholders": input_dict["template_with_placeholders"],
         }
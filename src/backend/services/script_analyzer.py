@@ -9,8 +9,8 @@ class ScriptAnalyzer:
     def analyze_template(self, template: SlideTemplate) -> Dict[str, any]:
         """Basic template analysis - simplified for LangChain workflow"""
         try:
-            content = template.read_slides_content()
-            placeholders = template.extract_placeholders(content)
+            # slides_source re-reads the file only when its mtime changes
+            placeholders = template.extract_placeholders()
 
             return {
                 "placeholders": placeholders,
@@ -1,11 +1,57 @@
+import hashlib
 import importlib
 import inspect
-from typing import Any, Dict
+import json
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Precomputed function info written next to a template package's sources
+# by scripts/build_template_meta.py
+META_FILENAME = "_meta.json"
+# Keys each function entry of a sidecar must provide
+_META_INFO_KEYS = {"docstring", "signature", "args_info"}
+
+# Indented (or blank) lines following "Args:" in a dedented docstring
+_ARGS_SECTION_PATTERN = re.compile(r"^Args:[ \t]*\n((?:[ \t]+\S.*\n?|[ \t]*\n)*)", re.M)
+# "name: description" entries; more deeply indented lines continue the description
+_ARG_ENTRY_PATTERN = re.compile(
+    r"^([ \t]+)([^:\n]+?)[ \t]*:[ \t]*(.*(?:\n\1[ \t]+\S.*)*)", re.M
+)
+
+
+@lru_cache(maxsize=512)
+def _parse_docstring_args(func) -> Dict[str, str]:
+    """Parse "Args:" descriptions from a function's docstring; memoized per function"""
+    doc = inspect.getdoc(func) or ""
+    section = _ARGS_SECTION_PATTERN.search(doc)
+    if section is None:
+        return {}
+
+    return {
+        name: " ".join(desc.split())
+        for _, name, desc in _ARG_ENTRY_PATTERN.findall(section.group(1))
+    }
+
+
+def _template_source_hash(package_dir: Path) -> str:
+    """Fingerprint a template package's sources to detect stale sidecars"""
+    digest = hashlib.blake2b(digest_size=16)
+    for source in sorted(package_dir.glob("*.py")):
+        digest.update(source.name.encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
 
 
 class SlidesLoader:
     """Load and inspect slide functions from template modules"""
 
+    def __init__(self):
+        # Function info per template id, filled on first load
+        self._func_cache: Dict[str, Dict[str, Any]] = {}
+
     def load_template_functions(self, template_id: str) -> Dict[str, Any]:
         """
         Load slide functions from a template module.
@@ -16,52 +62,105 @@ class SlidesLoader:
         Returns:
             Dictionary of function names to function info
         """
+        cached = self._func_cache.get(template_id)
+        if cached is not None:
+            return cached
+
         try:
             # Dynamic import of template module
             module = importlib.import_module(f"src.backend.templates.{template_id}")
+            meta = self._load_template_meta(module) or {}
 
             functions = {}
 
             # Get functions listed in __all__
             for func_name in getattr(module, "__all__", []):
                 func = getattr(module, func_name)
+                info = meta.get(func_name) or self._inspect_function(func)
+                functions[func_name] = {"function": func, **info}
 
-                functions[func_name] = {
-                    "function": func,
-                    "docstring": inspect.getdoc(func) or "",
-                    "signature": str(inspect.signature(func)),
-                    "args_info": self._parse_function_args(func),
-                }
-
+            self._func_cache[template_id] = functions
             return functions
 
         except ImportError as e:
             raise ImportError(f"Cannot load template '{template_id}': {e}")
 
-    def _parse_function_args(self, func) -> Dict[str, str]:
-        """Parse function arguments from docstring"""
-        doc = inspect.getdoc(func) or ""
-        args_info = {}
-
-        lines = doc.split("\n")
-        in_args_section = False
-
-        for line in lines:
-            line = line.strip()
-
-            if line == "Args:":
-                in_args_section = True
-                continue
-            elif line.startswith("Returns:") or line.startswith("Raises:"):
-                in_args_section = False
-                continue
+    def build_template_meta(self, template_id: str) -> Dict[str, Any]:
+        """
+        Introspect a template package into the _meta.json sidecar format.
 
-            if in_args_section and ":" in line:
-                arg_name = line.split(":")[0].strip()
-                arg_desc = ":".join(line.split(":")[1:]).strip()
-                args_info[arg_name] = arg_desc
+        Args:
+            template_id: Template identifier
 
-        return args_info
+        Returns:
+            Source hash and the docstring/signature/args_info of each function
+        """
+        module = importlib.import_module(f"src.backend.templates.{template_id}")
+        return {
+            "source_hash": _template_source_hash(Path(module.__file__).parent),
+            "functions": {
+                func_name: self._inspect_function(getattr(module, func_name))
+                for func_name in getattr(module, "__all__", [])
+            },
+        }
+
+    def _load_template_meta(self, module) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read the module's sidecar; None when missing or out of date"""
+        module_file = getattr(module, "__file__", None)
+        if module_file is None:
+            return None
+
+        package_dir = Path(module_file).parent
+        try:
+            meta = json.loads((package_dir / META_FILENAME).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None
+        if not isinstance(meta, dict):
+            return None
+
+        if meta.get("source_hash") != _template_source_hash(package_dir):
+            # Sources changed since the sidecar was built
+            return None
+
+        functions = meta.get("functions")
+        if not isinstance(functions, dict) or not all(
+            isinstance(info, dict) and _META_INFO_KEYS <= info.keys()
+            for info in functions.values()
+        ):
+            # Malformed sidecar; inspect the functions instead
+            return None
+        return functions
+
+    def _inspect_function(self, func) -> Dict[str, Any]:
+        """Collect docstring, signature and argument descriptions at runtime"""
+        return {
+            "docstring": inspect.getdoc(func) or "",
+            "signature": str(inspect.signature(func)),
+            "args_info": self._parse_function_args(func),
+        }
+
+    def clear_cache(self) -> None:
+        """Forget loaded templates and reload their modules so edits are re-inspected"""
+        for template_id in self._func_cache:
+            package = f"src.backend.templates.{template_id}"
+            # Submodules (slides.py) first, so the package re-imports fresh functions
+            names = [
+                name
+                for name in sys.modules
+                if name == package or name.startswith(package + ".")
+            ]
+            for name in sorted(names, reverse=True):
+                importlib.reload(sys.modules[name])
+        self._func_cache.clear()
+        _parse_docstring_args.cache_clear()
+
+    @staticmethod
+    def _parse_function_args(func) -> Dict[str, str]:
+        """Parse function arguments from docstring
+
+        The memoized result is shared, so callers get their own copy.
+        """
+        return dict(_parse_docstring_args(func))
 
     def create_slide_functions_summary(self, template_id: str) -> str:
         """
@@ -86,11 +185,13 @@ Purpose: {purpose}
 Signature: {info['signature']}
 
 Arguments:"""
+            # One join per function instead of growing func_doc line by line
+            arg_lines = "".join(
+                f"\n  - {arg_name}: {arg_desc}"
+                for arg_name, arg_desc in info["args_info"].items()
+            )
 
-            for arg_name, arg_desc in info["args_info"].items():
-                func_doc += f"\n  - {arg_name}: {arg_desc}"
-
-            summary_parts.append(func_doc)
+            summary_parts.append(func_doc + arg_lines)
 
         return "\n\n" + "=" * 50 + "\n\n".join(summary_parts)
 
@@ -1,13 +1,10 @@
-import tempfile
 import time
 import traceback
-from pathlib import Path
 
 import streamlit as st
 from pdf2image import convert_from_bytes
 
 from src.backend.chains.slide_gen_chain import SlideGenChain
-from src.backend.services import MarpService
 from src.protocols.schemas import OutputFormat
 
 
@@ -123,14 +120,14 @@ def generate_slides_with_llm():
         def execute_generation():
             """生成処理を実行する関数"""
             try:
-                if hasattr(generator, "llm"):
+                if isinstance(generator, SlideGenChain):
                     # SlideGenChainの場合、コールバック付きで再作成
                     generator_with_callback = SlideGenChain(
-                        generator.llm, progress_callback
+                        generator.client, progress_callback
                     )
 
-                    # 生成実行
-                    return generator_with_callback.invoke_slide_gen_chain(
+                    # 生成実行（スレッドごとのイベントループを再利用）
+                    return generator_with_callback.invoke_slide_gen_chain_sync(
                         script_content, template
                     )
                 else:
@@ -270,9 +267,13 @@ if not template:
 st.subheader(f"📋 {template.name}")
 
 format_options = {
-    "PDF": {"label": "📄 PDF", "format": OutputFormat.PDF},
-    "HTML": {"label": "🌐 HTML", "format": OutputFormat.HTML},
-    "PPTX": {"label": "📊 PPTX", "format": OutputFormat.PPTX},
+    "PDF": {"label": "📄 PDF", "format": OutputFormat.PDF, "mime": "application/pdf"},
+    "HTML": {"label": "🌐 HTML", "format": OutputFormat.HTML, "mime": "text/html"},
+    "PPTX": {
+        "label": "📊 PPTX",
+        "format": OutputFormat.PPTX,
+        "mime": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    },
 }
 
 selected_format_enum = format_options[selected_format]["format"]
@@ -331,66 +332,37 @@ try:
         st.stop()
 
     css_content = template.read_css_content()
+    # テンプレートのtheme.cssをそのまま--themeで渡す (CSSの一時ファイルは作らない)
+    theme_path = str(template.css_path)
 
     # CSSコンテンツの検証
     if not css_content:
         st.warning("⚠️ CSSコンテンツが見つかりません。デフォルトスタイルを使用します。")
         css_content = "/* Default CSS */"
+        theme_path = None
 
-    # 一時ファイルを作成してMarpServiceを使用
-    temp_dir = Path(tempfile.gettempdir()) / "auto-slides"
-    temp_dir.mkdir(exist_ok=True)
-
-    temp_md_path = temp_dir / f"{template.id}.md"
-    temp_css_path = temp_dir / f"{template.id}.css"
-
-    # マークダウンファイルを作成
-    with open(temp_md_path, "w", encoding="utf-8") as f:
-        if generated_markdown is None:
-            st.error("❌ 生成されたMarkdownコンテンツがNoneです。")
-            st.stop()
-        f.write(generated_markdown)
-
-    # CSSファイルを作成
-    with open(temp_css_path, "w", encoding="utf-8") as f:
-        if css_content is None:
-            css_content = "/* Default CSS */"
-        f.write(css_content)
+    if generated_markdown is None:
+        st.error("❌ 生成されたMarkdownコンテンツがNoneです。")
+        st.stop()
 
-    # MarpServiceを使用して変換
-    marp_service = MarpService(str(temp_md_path), str(temp_dir))
+    # セッションのMarpServiceを使用して変換 (Markdownは標準入力から渡し、一時ファイルは作らない)
+    # 同じ内容の再変換はサービスのキャッシュから返る
+    marp_service = st.session_state.marp_service
 
     # Marp変換処理を関数として定義
     def generate_file():
-        if selected_format == "PDF":
-            output_path = marp_service.generate_pdf(f"{template.id}.pdf")
-            with open(output_path, "rb") as f:
-                return f.read(), "application/pdf"
-        elif selected_format == "HTML":
-            output_path = marp_service.generate_html(f"{template.id}.html")
-            with open(output_path, "rb") as f:
-                return f.read(), "text/html"
-        elif selected_format == "PPTX":
-            output_path = marp_service.generate_pptx(f"{template.id}.pptx")
-            with open(output_path, "rb") as f:
-                return (
-                    f.read(),
-                    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                )
+        file_data = marp_service.convert_markdown(
+            generated_markdown, selected_format_enum, theme=theme_path
+        )
+        return file_data, format_options[selected_format]["mime"]
 
     # ファイル生成実行
     with st.spinner(f"{selected_format}生成中..."):
         file_data, mime_type = generate_file()
 
     # ダウンロードボタン
-    filename = f"{template.id}.{selected_format_enum.value}"
-
-    if selected_format == "PDF":
-        download_label = "PDFファイルをダウンロード"
-    elif selected_format == "HTML":
-        download_label = "HTMLファイルをダウンロード"
-    elif selected_format == "PPTX":
-        download_label = "PPTXファイルをダウンロード"
+    filename = marp_service.output_filename(template.id, selected_format_enum)
+    download_label = f"{selected_format}ファイルをダウンロード"
 
     st.download_button(
         label=download_label,
@@ -426,9 +398,9 @@ try:
             preview_data = file_data
         else:
             # HTML/PPTXは一度PDFに変換してからプレビュー
-            preview_path = marp_service.generate_pdf(f"preview_{template.id}.pdf")
-            with open(preview_path, "rb") as f:
-                preview_data = f.read()
+            preview_data = marp_service.convert_markdown(
+                generated_markdown, OutputFormat.PDF, theme=theme_path
+            )
 
         # PDF to Image変換
         return convert_from_bytes(preview_data)
@@ -465,8 +437,5 @@ except Exception as e:
                 len(generated_markdown) if generated_markdown else 0
             ),
             "CSS Content Length": len(css_content) if css_content else 0,
-            "Temp Directory Available": (
-                temp_dir.exists() if "temp_dir" in locals() else "Unknown"
-            ),
         }
         st.json(debug_info)
@@ -1,10 +1,17 @@
-from typing import Protocol
+from typing import BinaryIO, List, Protocol
+
+from src.protocols.schemas import OutputFormat
 
 
 class MarpProtocol(Protocol):
-    slides_path: str
+    slides_path: str | None
     output_dir: str | None
 
+    @staticmethod
+    def output_filename(name: str, output_type: OutputFormat) -> str:
+        """Return the output file name for a slides name and format"""
+        ...
+
     def generate_pdf(
         self, output_filename: str = "slides.pdf", theme: str | None = None
     ) -> str:
@@ -29,6 +36,37 @@ class MarpProtocol(Protocol):
         """Generate PPTX from slides"""
         ...
 
+    def convert_markdown(
+        self,
+        markdown: str,
+        output_type: OutputFormat,
+        theme: str | None = None,
+        out_stream: BinaryIO | None = None,
+        use_marp: bool = True,
+    ) -> bytes | None:
+        """Convert Markdown text without writing intermediate files"""
+        ...
+
+    def generate_batch(
+        self,
+        slides_paths: List[str],
+        output_type: OutputFormat,
+        theme: str | None = None,
+        parallel: int | None = None,
+    ) -> List[str]:
+        """Generate one output per slides file in a single conversion run"""
+        ...
+
+    def generate_parallel(
+        self,
+        slides_paths: List[str],
+        output_type: OutputFormat,
+        theme: str | None = None,
+        workers: int = 5,
+    ) -> List[str]:
+        """Generate one output per slides file with concurrent conversions"""
+        ...
+
     def preview(self, server: bool = True, watch: bool = True) -> None:
         """Launch Marp preview"""
         ...
@@ -1,6 +1,6 @@
 import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -65,14 +65,24 @@ def marp_service(sample_template_path, temp_output_dir):
 # TemplateConverterService removed - using MarpService instead
 
 
+@dataclass(frozen=True)
+class StubTemplate:
+    """Lightweight stand-in for SlideTemplate with only what the chain reads"""
+
+    id: str = "test_template"
+    name: str = "Test Template"
+    description: str = "Test template"
+    duration_minutes: int = 10
+    slides_content: str = "# Test Slide\n\nTest content"
+
+    def read_slides_content(self) -> str:
+        return self.slides_content
+
+
 @pytest.fixture
 def mock_template():
-    """Mock SlideTemplate for unit tests"""
-    template = MagicMock(spec=SlideTemplate)
-    template.id = "test_template"
-    template.name = "Test Template"
-    template.read_markdown_content.return_value = "# Test Slide\n\nTest content"
-    return template
+    """Stub SlideTemplate for tests; avoids MagicMock spec introspection"""
+    return StubTemplate()
 
 
 @pytest.fixture
@@ -7,27 +7,16 @@ Tests the complete slide generation workflow using streamlit secrets:
 - USE_LOCAL_CLIENT=false: Uses OllamaApiClient (remote)
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from src.backend.chains.slide_gen_chain import SlideGenChain
-from src.backend.models.slide_template import SlideTemplate
 
 
 class TestSlideGenChainE2E:
     """End-to-end tests for SlideGenChain with streamlit secrets configuration"""
 
-    @pytest.fixture
-    def mock_template(self):
-        """Create a mock SlideTemplate for testing"""
-        template = MagicMock(spec=SlideTemplate)
-        template.id = "test_template"
-        template.name = "E2E Test Template"
-        template.description = "End-to-end test template"
-        template.duration_minutes = 10
-        return template
-
     @pytest.fixture
     def test_script_content(self):
         """Sample script content for testing"""
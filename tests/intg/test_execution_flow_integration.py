@@ -13,7 +13,6 @@ import streamlit as st
 
 from dev.mocks import MockSlideGenerator
 from src.backend.chains.slide_gen_chain import SlideGenChain
-from src.backend.models.slide_template import SlideTemplate
 from src.frontend.app_state import AppState
 from src.protocols.schemas import OutputFormat
 
@@ -21,16 +20,6 @@ from src.protocols.schemas import OutputFormat
 class TestExecutionFlowIntegration:
     """Integration tests for execution button flow"""
 
-    @pytest.fixture
-    def mock_template(self):
-        """Create a mock SlideTemplate for testing"""
-        template = MagicMock(spec=SlideTemplate)
-        template.id = "test_template"
-        template.name = "Test Template"
-        template.description = "Integration test template"
-        template.duration_minutes = 10
-        return template
-
     @pytest.fixture
     def mock_session_state(self, mock_template):
         """Setup mock session state with necessary data"""
@@ -188,7 +177,6 @@ theme: default
             assert "marp: true" in generated_markdown
 
     @patch("streamlit.secrets", {"DEBUG": "true", "OLLAMA_MODEL": "mock_model"})
-    @pytest.mark.asyncio
     async def test_real_slide_gen_chain_error_detection(self, mock_template):
         """Test that real SlideGenChain errors are properly detected and fixed"""
         # Use a real SlideGenChain to test actual functionality
@@ -3,6 +3,7 @@ UI tests for the new chain integration in pages.
 Tests the integration of SlideGenChain and services with UI components.
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import streamlit as st
@@ -47,10 +48,11 @@ Thank you for your attention.
 """
 
             # Create mock template
-            mock_template = MagicMock(spec=SlideTemplate)
-            mock_template.name = "Chain Test Template"
-            mock_template.description = "Template for testing chain integration"
-            mock_template.id = "test_template"
+            mock_template = SimpleNamespace(
+                name="Chain Test Template",
+                description="Template for testing chain integration",
+                id="test_template",
+            )
 
             mock_app_state = MagicMock()
             mock_app_state.selected_template = mock_template
@@ -164,8 +166,7 @@ Thank you for your attention.
             "Chain workflow error"
         )
 
-        mock_template = MagicMock(spec=SlideTemplate)
-        mock_template.id = "test_template"
+        mock_template = SimpleNamespace(id="test_template")
         mock_app_state = MagicMock()
         mock_app_state.selected_template = mock_template
 
@@ -311,9 +312,10 @@ ${conclusion}
         from dev.mocks import MockSlideGenerator
 
         # Create a mock template for the test
-        mock_template = MagicMock(spec=SlideTemplate)
-        mock_template.id = "test_mock_template"
-        mock_template.name = "Mock Template"
+        mock_template = SimpleNamespace(
+            id="test_mock_template",
+            name="Mock Template",
+        )
 
         # Instantiate the mock generator
         mock_generator = MockSlideGenerator()
@@ -336,10 +338,11 @@ ${conclusion}
         from dev.mocks import MockSlideGenerator
 
         # 1. Setup Mocks and Session State
-        mock_template = MagicMock(spec=SlideTemplate)
-        mock_template.id = "ui_mock_test"
-        mock_template.name = "UI Mock Test Template"
-        mock_template.read_css_content.return_value = "/* css */"
+        mock_template = SimpleNamespace(
+            id="ui_mock_test",
+            name="UI Mock Test Template",
+            read_css_content=MagicMock(return_value="/* css */"),
+        )
 
         mock_generator = MockSlideGenerator()
 
@@ -26,9 +26,11 @@ class TestGalleryPageLogic:
             # Test with mock templates
             mock_get_templates.reset_mock()
             mock_template1 = MagicMock(spec=SlideTemplate)
-            mock_template1.id = "template1"
-            mock_template1.name = "Template 1"
-            mock_template1.description = "Description 1"
+            mock_template1.configure_mock(
+                id="template1",
+                name="Template 1",
+                description="Description 1",
+            )
 
             mock_get_templates.return_value = [mock_template1]
 
@@ -41,8 +43,7 @@ class TestGalleryPageLogic:
         with patch("streamlit.switch_page") as mock_switch_page:
             # Create mock template
             mock_template = MagicMock(spec=SlideTemplate)
-            mock_template.id = "template1"
-            mock_template.name = "Test Template"
+            mock_template.configure_mock(id="template1", name="Test Template")
 
             # Mock session_state with app_state
             mock_app_state = MagicMock()
@@ -97,8 +98,7 @@ class TestGalleryPageLogic:
         """Test template button properties logic"""
         # Simulate button creation logic from gallery_page.py
         mock_template = MagicMock(spec=SlideTemplate)
-        mock_template.id = "template1"
-        mock_template.name = "Test Template"
+        mock_template.configure_mock(id="template1", name="Test Template")
 
         # Button label format
         button_label = f"{mock_template.name} を使う"
@@ -147,8 +147,10 @@ class TestGalleryPageLogic:
     def test_template_card_styling_logic(self):
         """Test template card styling logic"""
         mock_template = MagicMock(spec=SlideTemplate)
-        mock_template.name = "Test Template"
-        mock_template.description = "Test Description"
+        mock_template.configure_mock(
+            name="Test Template",
+            description="Test Description",
+        )
 
         # Simulate card HTML generation logic
         card_html = f"""
@@ -107,8 +107,10 @@ class TestImplementationPageLogic:
 
             # Create mock template and session state
             mock_template = MagicMock(spec=SlideTemplate)
-            mock_template.name = "Test Template"
-            mock_template.description = "Test Description"
+            mock_template.configure_mock(
+                name="Test Template",
+                description="Test Description",
+            )
 
             mock_app_state = MagicMock()
             mock_app_state.selected_template = mock_template
@@ -1,9 +1,9 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 import streamlit as st
 
-from src.backend.models.slide_template import SlideTemplate
 from src.protocols.schemas import OutputFormat
 
 # Test the progress functionality without direct imports to avoid streamlit issues
@@ -64,7 +64,7 @@ class TestResultPageLogic:
         """Test redirect logic when generated_markdown is None"""
         with patch("streamlit.switch_page") as mock_switch_page:
             # Mock session_state with app_state but no generated_markdown
-            mock_template = MagicMock(spec=SlideTemplate)
+            mock_template = SimpleNamespace()
             mock_app_state = MagicMock()
             mock_app_state.selected_template = mock_template
             mock_app_state.generated_markdown = None
@@ -91,7 +91,7 @@ class TestResultPageLogic:
         """Test redirect logic when selected_format is missing"""
         with patch("streamlit.switch_page") as mock_switch_page:
             # Mock session_state without selected_format
-            mock_template = MagicMock(spec=SlideTemplate)
+            mock_template = SimpleNamespace()
             mock_app_state = MagicMock()
             mock_app_state.selected_template = mock_template
             mock_app_state.generated_markdown = "# Test"
@@ -121,8 +121,9 @@ class TestResultPageLogic:
         """Test no redirect when all required session data is present"""
         with patch("streamlit.switch_page") as mock_switch_page:
             # Create mock template
-            mock_template = MagicMock(spec=SlideTemplate)
-            mock_template.name = "Test Template"
+            mock_template = SimpleNamespace(
+                name="Test Template",
+            )
 
             # Create mock app_state
             mock_app_state = MagicMock()
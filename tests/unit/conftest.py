@@ -0,0 +1,22 @@
+from unittest.mock import patch
+
+import pytest
+
+# Secrets seen by every unit test; individual tests only patch what differs
+UNIT_TEST_SECRETS = {
+    "DEBUG": "false",
+    "OLLAMA_MODEL": "mock_model",
+    "ARGUMENT_FLOW_DIVISOR": 4,
+    "TARGET_SLIDE_COUNT": 3,
+}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def unit_test_secrets():
+    """Patch streamlit.secrets once per module instead of once per test
+
+    Module scope keeps the patch from leaking into the ui/intg/e2e suites,
+    which configure secrets themselves.
+    """
+    with patch("streamlit.secrets", UNIT_TEST_SECRETS):
+        yield UNIT_TEST_SECRETS
@@ -1,10 +1,15 @@
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from src.backend.models.slide_template import SlideTemplate
+from src.backend.models.slide_template import (
+    PLACEHOLDER_PATTERN,
+    SlideTemplate,
+    find_placeholders,
+)
 
 
 class TestSlideTemplate:
@@ -256,3 +261,117 @@ class TestSlideTemplate:
 
             with pytest.raises(FileNotFoundError):
                 template.read_css_content()
+
+    def test_render_template_replaces_known_placeholders(self):
+        """Test render_template substitutes variables and keeps unknown ones"""
+        template = SlideTemplate(
+            id="test",
+            name="Test",
+            description="Test",
+            template_dir=Path("/test/template"),
+            duration_minutes=10,
+        )
+
+        result = template.render_template(
+            "# ${title}\n${title} by ${author}\n${unknown}",
+            {"title": "Hello", "author": "Me"},
+        )
+
+        assert result == "# Hello\nHello by Me\n${unknown}"
+
+    def test_render_template_does_not_expand_substituted_values(self):
+        """Test values containing placeholder syntax are inserted verbatim"""
+        template = SlideTemplate(
+            id="test",
+            name="Test",
+            description="Test",
+            template_dir=Path("/test/template"),
+            duration_minutes=10,
+        )
+
+        result = template.render_template(
+            "${first} ${second}", {"first": "${second}", "second": "two"}
+        )
+
+        assert result == "${second} two"
+
+    def test_render_template_without_placeholders_returns_input(self):
+        """Test placeholder-free content is returned as-is without substitution"""
+        template = SlideTemplate(
+            id="test",
+            name="Test",
+            description="Test",
+            template_dir=Path("/test/template"),
+            duration_minutes=10,
+        )
+        content = "# Plain prose slide\n\nCosts $5 {not a placeholder}"
+
+        with patch(
+            "src.backend.models.slide_template.PLACEHOLDER_PATTERN"
+        ) as mock_pattern:
+            result = template.render_template(content, {"title": "Unused"})
+
+        assert result is content
+        mock_pattern.sub.assert_not_called()
+
+    def test_slides_source_is_read_once(self, tmp_path):
+        """Test slides_source caches the slides content on the instance"""
+        (tmp_path / "slides.py").write_text("# ${title}\n${content}")
+        template = SlideTemplate(
+            id="test",
+            name="Test",
+            description="Test",
+            template_dir=tmp_path,
+            duration_minutes=10,
+        )
+
+        with patch.object(
+            Path, "read_text", autospec=True, side_effect=Path.read_text
+        ) as mock_read_text:
+            assert template.slides_source == "# ${title}\n${content}"
+            assert template.extract_placeholders() == {"title", "content"}
+
+        mock_read_text.assert_called_once()
+
+    def test_slides_source_rereads_modified_file(self, tmp_path):
+        """Test slides_source picks up edits to slides.py"""
+        slides_path = tmp_path / "slides.py"
+        slides_path.write_text("# ${title}")
+        template = SlideTemplate(
+            id="test",
+            name="Test",
+            description="Test",
+            template_dir=tmp_path,
+            duration_minutes=10,
+        )
+        assert template.slides_source == "# ${title}"
+
+        slides_path.write_text("# ${title}\n${subtitle}")
+        stat = slides_path.stat()
+        os.utime(slides_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert template.slides_source == "# ${title}\n${subtitle}"
+
+    @pytest.mark.parametrize(
+        "content",
+        ["", "# Plain slide\n$5 {not one}", "$ {spaced}", "${}", "trailing ${open"],
+    )
+    def test_find_placeholders_without_placeholders(self, content):
+        """Test content without complete, named placeholders yields nothing"""
+        assert find_placeholders(content) == set()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "# ${title}\n\n${content}\n\n## ${author}",
+        "${a} ${a} ${b}",
+        "${} ${ } $ {x} ${unterminated",
+        "${outer ${inner}} tail}",
+        "${multi\nline} ${x}${y}",
+    ],
+)
+def test_find_placeholders_matches_regex(content):
+    """find_placeholders agrees with PLACEHOLDER_PATTERN on edge cases"""
+    assert find_placeholders(content) == set(PLACEHOLDER_PATTERN.findall(content))
@@ -1,38 +1,72 @@
 """Tests for MarpService"""
 
+import gc
+import io
+import os
 import subprocess
-import tempfile
+import urllib.request
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
-from src.backend.services import MarpService
+from src.backend.services import MarpServer, MarpService
+from src.backend.services.marp_service import render_html
 from src.protocols.schemas import OutputFormat
 
+_OK_RESULT = SimpleNamespace(stdout="Success", stderr="", returncode=0)
+
+# (format, MarpService method, default output name) for every generate_* method
+GENERATE_CASES = [
+    (OutputFormat.PDF, "generate_pdf", "test.pdf"),
+    (OutputFormat.HTML, "generate_html", "test.html"),
+    (OutputFormat.PNG, "generate_png", "test.png"),
+    (OutputFormat.PPTX, "generate_pptx", "test.pptx"),
+]
+
+# (format, formatted output file name) for the "test" stem
+OUTPUT_FILENAME_CASES = [
+    (output_format, output_filename)
+    for output_format, _, output_filename in GENERATE_CASES
+]
+
+# (format, Marp CLI flags) used when the format cannot come from a file name
+FORMAT_FLAG_CASES = [
+    (OutputFormat.PDF, ["--pdf"]),
+    (OutputFormat.HTML, []),
+    (OutputFormat.PNG, ["--image", "png"]),
+    (OutputFormat.PPTX, ["--pptx"]),
+]
+
+
+@pytest.fixture(autouse=True)
+def mock_run(monkeypatch):
+    """Patch subprocess.run for every test; marp succeeds unless overridden"""
+    mock = MagicMock(return_value=_OK_RESULT)
+    monkeypatch.setattr(subprocess, "run", mock)
+    return mock
+
 
 class TestMarpService:
     """Test MarpService functionality"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        # Create temporary files for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.slides_file = Path(self.temp_dir) / "test_slides.md"
+    @pytest.fixture(autouse=True)
+    def setup_slides(self, tmp_path):
+        """Set up test slides in pytest's per-test temporary directory"""
+        self.slides_file = tmp_path / "test_slides.md"
         self.slides_file.write_text("# Test Slide\n\nContent")
-        self.output_dir = Path(self.temp_dir) / "output"
+        self.output_dir = tmp_path / "output"
 
-    def teardown_method(self):
-        """Clean up test files"""
-        import shutil
-
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
+    @pytest.fixture
+    def service(self):
+        """Service bound to this test's slides and output directory"""
+        return MarpService(str(self.slides_file), str(self.output_dir))
 
     def test_init_creates_output_dir(self):
         """Test that initialization creates output directory"""
         service = MarpService(str(self.slides_file), str(self.output_dir))
-        assert self.output_dir.exists()
+        assert self.output_dir.is_dir()
         assert service.slides_path == str(self.slides_file)
         assert service.output_dir == str(self.output_dir)
 
@@ -43,22 +77,12 @@ class TestMarpService:
         assert service.output_dir is None
 
     @pytest.mark.parametrize(
-        "output_format, method_name, output_filename",
-        [
-            (OutputFormat.PDF, "generate_pdf", "test.pdf"),
-            (OutputFormat.HTML, "generate_html", "test.html"),
-            (OutputFormat.PNG, "generate_png", "test.png"),
-            (OutputFormat.PPTX, "generate_pptx", "test.pptx"),
-        ],
+        "output_format, method_name, output_filename", GENERATE_CASES
     )
-    @patch("subprocess.run")
     def test_generate_success(
-        self, mock_run, output_format, method_name, output_filename
+        self, mock_run, output_format, method_name, output_filename, service
     ):
         """Test successful generation for all formats"""
-        mock_run.return_value = Mock(stdout="Success", stderr="")
-
-        service = MarpService(str(self.slides_file), str(self.output_dir))
         generator_method = getattr(service, method_name)
         result = generator_method(output_filename)
 
@@ -72,12 +96,17 @@ class TestMarpService:
             text=True,
         )
 
-    @patch("subprocess.run")
-    def test_generate_with_theme(self, mock_run):
-        """Test generation with custom theme"""
-        mock_run.return_value = Mock(stdout="Success", stderr="")
+    @pytest.mark.parametrize("output_format, output_filename", OUTPUT_FILENAME_CASES)
+    def test_output_filename(self, output_format, output_filename):
+        """Test that output names are formatted once and then reused"""
+        first = MarpService.output_filename("test", output_format)
+        second = MarpService.output_filename("test", output_format)
 
-        service = MarpService(str(self.slides_file), str(self.output_dir))
+        assert first == output_filename
+        assert first is second
+
+    def test_generate_with_theme(self, mock_run, service):
+        """Test generation with custom theme"""
         result = service.generate_pdf("test.pdf", theme="custom_theme.css")
 
         expected_path = str(self.output_dir / "test.pdf")
@@ -97,64 +126,316 @@ class TestMarpService:
             text=True,
         )
 
-    def test_generate_without_output_dir_raises_error(self):
-        """Test that generation without output directory raises error"""
-        service = MarpService(str(self.slides_file))
-
-        with pytest.raises(ValueError, match="Output directory must be set"):
-            service.generate_pdf("test.pdf")
-
-    @patch("subprocess.run")
-    def test_generate_subprocess_error(self, mock_run):
+    @pytest.mark.parametrize(
+        "output_format, method_name, output_filename", GENERATE_CASES
+    )
+    def test_generate_subprocess_error(
+        self, mock_run, output_format, method_name, output_filename, service
+    ):
         """Test handling of subprocess errors during generation"""
         mock_run.side_effect = subprocess.CalledProcessError(
             returncode=1, cmd=["marp"], stderr="Marp error"
         )
 
-        service = MarpService(str(self.slides_file), str(self.output_dir))
+        with pytest.raises(subprocess.CalledProcessError):
+            getattr(service, method_name)(output_filename)
+
+    @pytest.mark.parametrize("output_format, format_flags", FORMAT_FLAG_CASES)
+    def test_generate_batch_runs_marp_once(
+        self, mock_run, output_format, format_flags, service
+    ):
+        """Test that a batch of slide files is converted in one Marp run"""
+        slides_files = []
+        for name in ("first", "second", "third"):
+            slides_file = self.slides_file.with_name(f"{name}.md")
+            slides_file.write_text(f"# {name}")
+            slides_files.append(str(slides_file))
+        staged = {}
+
+        def fake_run(command, **kwargs):
+            input_dir = Path(command[command.index("--input-dir") + 1])
+            staged.update((p.name, p.read_text()) for p in input_dir.iterdir())
+            return _OK_RESULT
+
+        mock_run.side_effect = fake_run
+        result = service.generate_batch(slides_files, output_format)
+
+        assert mock_run.call_count == 1
+        command = mock_run.call_args.args[0]
+        input_dir = command[command.index("--input-dir") + 1]
+        assert command == [
+            "marp",
+            "--input-dir",
+            input_dir,
+            "-o",
+            str(self.output_dir),
+            *format_flags,
+        ]
+        assert staged == {
+            "first.md": "# first",
+            "second.md": "# second",
+            "third.md": "# third",
+        }
+        assert result == [
+            str(self.output_dir / f"{name}.{output_format.value}")
+            for name in ("first", "second", "third")
+        ]
+
+    @pytest.mark.parametrize("output_format, format_flags", FORMAT_FLAG_CASES)
+    def test_convert_markdown_uses_pipes(self, mock_run, output_format, format_flags):
+        """Test that Markdown goes in on stdin and the output comes from stdout"""
+        mock_run.return_value = SimpleNamespace(stdout=b"converted", returncode=0)
+        service = MarpService()
+
+        result = service.convert_markdown("# Test Slide", output_format)
+
+        mock_run.assert_called_once_with(
+            ["marp", "-o", "-"] + format_flags,
+            input=b"# Test Slide",
+            check=True,
+            capture_output=True,
+        )
+        assert result == b"converted"
+        assert service.slides_path is None
+
+    def test_convert_markdown_with_theme_file(self, mock_run):
+        """Test that a theme CSS file is handed to Marp instead of being copied"""
+        mock_run.return_value = SimpleNamespace(stdout=b"converted", returncode=0)
+        theme_file = self.slides_file.with_name("theme.css")
+        theme_file.write_text("/* @theme custom-theme */")
+
+        MarpService().convert_markdown(
+            "# Test Slide", OutputFormat.PDF, theme=str(theme_file)
+        )
+
+        command = mock_run.call_args.args[0]
+        assert command[-2:] == ["--theme", str(theme_file)]
+        assert sorted(p.name for p in theme_file.parent.iterdir()) == [
+            "test_slides.md",
+            "theme.css",
+        ]
+
+    def test_convert_markdown_html_without_marp(self, mock_run):
+        """Test that in-process HTML rendering inlines the theme and skips Marp"""
+        theme_file = self.slides_file.with_name("theme.css")
+        theme_file.write_text("section { color: red; }")
+
+        result = MarpService().convert_markdown(
+            "# Test Slide", OutputFormat.HTML, theme=str(theme_file), use_marp=False
+        )
+
+        html = result.decode("utf-8")
+        assert "<h1>Test Slide</h1>" in html
+        assert "section { color: red; }" in html
+        mock_run.assert_not_called()
+
+    def test_convert_markdown_without_marp_rejects_binary_formats(self, mock_run):
+        """Test that only HTML can skip Marp"""
+        with pytest.raises(ValueError, match="Only HTML"):
+            MarpService().convert_markdown("# Test", OutputFormat.PDF, use_marp=False)
+        mock_run.assert_not_called()
+
+    def test_convert_markdown_subprocess_error(self, mock_run):
+        """Test that Marp failures propagate from in-memory conversion"""
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1, cmd=["marp"], stderr=b"Marp error"
+        )
 
         with pytest.raises(subprocess.CalledProcessError):
-            service.generate_pdf("test.pdf")
+            MarpService().convert_markdown("# Test Slide", OutputFormat.PDF)
+
+    def test_convert_markdown_streams_output(self, monkeypatch, mock_run):
+        """Test that streamed output is copied from Marp's stdout"""
+        process = MagicMock(stdout=io.BytesIO(b"PDF content"), stderr=io.BytesIO())
+        process.__enter__.return_value = process
+        process.wait.return_value = 0
+        mock_popen = MagicMock(return_value=process)
+        monkeypatch.setattr(subprocess, "Popen", mock_popen)
+        out_stream = io.BytesIO()
+
+        result = MarpService().convert_markdown(
+            "# Test Slide", OutputFormat.PDF, out_stream=out_stream
+        )
+
+        assert result is None
+        assert out_stream.getvalue() == b"PDF content"
+        assert mock_popen.call_args.args[0] == ["marp", "-o", "-", "--pdf"]
+        process.stdin.write.assert_called_once_with(b"# Test Slide")
+        process.stdin.close.assert_called_once()
+        mock_run.assert_not_called()
+
+    def test_convert_markdown_stream_error(self, monkeypatch):
+        """Test that a failing streamed conversion raises CalledProcessError"""
+        process = MagicMock(stdout=io.BytesIO(), stderr=io.BytesIO(b"Marp error"))
+        process.__enter__.return_value = process
+        process.wait.return_value = 1
+        monkeypatch.setattr(subprocess, "Popen", MagicMock(return_value=process))
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            MarpService().convert_markdown(
+                "# Test Slide", OutputFormat.PDF, out_stream=io.BytesIO()
+            )
+        assert exc_info.value.stderr == b"Marp error"
+
+    def test_convert_markdown_stream_kills_marp_on_write_failure(self, monkeypatch):
+        """Test that Marp is killed and reaped when the output stream fails"""
+        process = MagicMock(stdout=io.BytesIO(b"PDF content"), stderr=io.BytesIO())
+        process.__enter__.return_value = process
+        monkeypatch.setattr(subprocess, "Popen", MagicMock(return_value=process))
+        out_stream = MagicMock()
+        out_stream.write.side_effect = BrokenPipeError("client disconnected")
+
+        with pytest.raises(BrokenPipeError):
+            MarpService().convert_markdown(
+                "# Test Slide", OutputFormat.PDF, out_stream=out_stream
+            )
+
+        process.kill.assert_called_once()
+        process.__exit__.assert_called_once()
+
+    def test_convert_markdown_streams_cached_output(self, mock_run):
+        """Test that a cached conversion is written to the stream"""
+        mock_run.return_value = SimpleNamespace(stdout=b"PDF content", returncode=0)
+        service = MarpService()
+        service.convert_markdown("# Test Slide", OutputFormat.PDF)
+        out_stream = io.BytesIO()
+
+        service.convert_markdown(
+            "# Test Slide", OutputFormat.PDF, out_stream=out_stream
+        )
+
+        assert out_stream.getvalue() == b"PDF content"
+        assert mock_run.call_count == 1
+
+    def test_convert_markdown_cache_hit(self, mock_run, service):
+        """Test that unchanged Markdown is converted by Marp only once"""
+        mock_run.return_value = SimpleNamespace(stdout=b"converted", returncode=0)
+
+        first = service.convert_markdown("# Test Slide", OutputFormat.PDF)
+        second = service.convert_markdown("# Test Slide", OutputFormat.PDF)
+        service.convert_markdown("# Test Slide", OutputFormat.PPTX)
+        service.convert_markdown("# Test Slide", OutputFormat.PDF, theme="gaia")
+
+        assert first == second == b"converted"
+        assert mock_run.call_count == 3
+
+    def test_convert_markdown_encodes_once(self, mock_run):
+        """Test that non-ASCII Markdown is encoded for stdin and cached by its bytes"""
+        mock_run.return_value = SimpleNamespace(stdout=b"converted", returncode=0)
+        markdown = "# スライド"
+
+        service = MarpService()
+        service.convert_markdown(markdown, OutputFormat.PDF)
+        service.convert_markdown(markdown, OutputFormat.PDF)
+
+        assert mock_run.call_args.kwargs["input"] == markdown.encode("utf-8")
+        assert mock_run.call_count == 1
+
+    def test_convert_markdown_cache_evicts_oldest(self, mock_run, service):
+        """Test that the cache drops least recently used output over its byte cap"""
+        mock_run.return_value = SimpleNamespace(stdout=b"converted", returncode=0)
+        service.MAX_CACHE_BYTES = 2 * len(b"converted")
+
+        service.convert_markdown("# One", OutputFormat.PDF)
+        service.convert_markdown("# Two", OutputFormat.PDF)
+        service.convert_markdown("# One", OutputFormat.PDF)
+        service.convert_markdown("# Three", OutputFormat.PDF)
+        service.convert_markdown("# One", OutputFormat.PDF)
+        service.convert_markdown("# Two", OutputFormat.PDF)
+
+        assert mock_run.call_count == 4
+
+    def test_convert_markdown_skips_caching_oversized_output(self, mock_run, service):
+        """Test that output larger than the whole cache is never stored"""
+        mock_run.return_value = SimpleNamespace(stdout=b"x" * 16, returncode=0)
+        service.MAX_CACHE_BYTES = 8
+
+        service.convert_markdown("# Big", OutputFormat.PDF)
+        service.convert_markdown("# Big", OutputFormat.PDF)
+
+        assert mock_run.call_count == 2
+        assert service._conversion_cache_bytes == 0
+
+    def test_convert_markdown_theme_edit_invalidates_cache(self, mock_run, service):
+        """Test that editing the theme CSS file forces a new conversion"""
+        mock_run.return_value = SimpleNamespace(stdout=b"converted", returncode=0)
+        theme_file = self.slides_file.with_name("theme.css")
+        theme_file.write_text("section { color: red; }")
+
+        service.convert_markdown("# Slide", OutputFormat.PDF, theme=str(theme_file))
+        service.convert_markdown("# Slide", OutputFormat.PDF, theme=str(theme_file))
+        theme_file.write_text("section { color: blue; }")
+        stat = theme_file.stat()
+        os.utime(theme_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        service.convert_markdown("# Slide", OutputFormat.PDF, theme=str(theme_file))
+
+        assert mock_run.call_count == 2
+
+    def test_generate_batch_passes_parallel(self, mock_run, service):
+        """Test that the batch run forwards the requested concurrency"""
+        service.generate_batch([str(self.slides_file)], OutputFormat.PDF, parallel=3)
+
+        command = mock_run.call_args.args[0]
+        assert command[-2:] == ["--parallel", "3"]
+
+    def test_generate_parallel_runs_marp_per_file(self, mock_run, service):
+        """Test that each slide file gets its own Marp run, results in order"""
+        slides_files = []
+        for name in ("first", "second", "third"):
+            slides_file = self.slides_file.with_name(f"{name}.md")
+            slides_file.write_text(f"# {name}")
+            slides_files.append(str(slides_file))
+
+        result = service.generate_parallel(slides_files, OutputFormat.PDF, workers=3)
+
+        expected = [
+            str(self.output_dir / f"{name}.pdf")
+            for name in ("first", "second", "third")
+        ]
+        assert mock_run.call_count == 3
+        commands = sorted(call.args[0] for call in mock_run.call_args_list)
+        assert commands == sorted(
+            ["marp", slides_file, "-o", output_path]
+            for slides_file, output_path in zip(slides_files, expected)
+        )
+        assert result == expected
 
-    @patch("subprocess.run")
-    def test_preview_default_options(self, mock_run):
+    def test_preview_default_options(self, mock_run, service):
         """Test preview with default options"""
-        service = MarpService(str(self.slides_file), str(self.output_dir))
         service.preview()
 
         mock_run.assert_called_once_with(
             ["marp", str(self.slides_file), "-s", "-w"], check=True
         )
 
-    @patch("subprocess.run")
-    def test_preview_custom_options(self, mock_run):
+    def test_preview_custom_options(self, mock_run, service):
         """Test preview with custom options"""
-        service = MarpService(str(self.slides_file), str(self.output_dir))
         service.preview(server=False, watch=False)
 
         mock_run.assert_called_once_with(["marp", str(self.slides_file)], check=True)
 
-    @patch("subprocess.run")
-    def test_preview_subprocess_error(self, mock_run):
+    @pytest.mark.timeout(2)
+    def test_preview_subprocess_error(self, mock_run, service):
         """Test handling of subprocess errors during preview"""
         mock_run.side_effect = subprocess.CalledProcessError(
             returncode=1, cmd=["marp"], stderr="Preview error"
         )
 
-        service = MarpService(str(self.slides_file), str(self.output_dir))
-
         with pytest.raises(subprocess.CalledProcessError):
             service.preview()
 
-    @patch("subprocess.run")
-    def test_preview_keyboard_interrupt(self, mock_run):
+    @pytest.mark.timeout(2)
+    def test_preview_keyboard_interrupt(self, mock_run, service):
         """Test handling of KeyboardInterrupt during preview"""
         mock_run.side_effect = KeyboardInterrupt()
 
-        service = MarpService(str(self.slides_file), str(self.output_dir))
-
-        # Should not raise exception, just log and return
-        service.preview()
+        # Should not raise exception, just log and return.
+        # An escaping KeyboardInterrupt would abort the whole pytest session,
+        # so turn it into a regular test failure instead.
+        try:
+            service.preview()
+        except KeyboardInterrupt:
+            pytest.fail("preview() must handle KeyboardInterrupt")
 
     def test_output_format_enum_access(self):
         """Test that OutputFormat enum is accessible through service"""
@@ -163,3 +444,223 @@ class TestMarpService:
         assert service.OutputFormat.HTML == OutputFormat.HTML
         assert service.OutputFormat.PNG == OutputFormat.PNG
         assert service.OutputFormat.PPTX == OutputFormat.PPTX
+
+
+def test_render_html_splits_slides():
+    """Test that front matter is dropped and each slide becomes a section"""
+    markdown = (
+        "---\nmarp: true\ntheme: custom-theme\n---\n\n# First\n\n---\n\n"
+        "## Second\n\n```yaml\n---\n```\n"
+    )
+
+    html = render_html(markdown)
+
+    assert "marp: true" not in html
+    assert html.count("<section>") == 2
+    assert "<h1>First</h1>" in html
+    assert "<h2>Second</h2>" in html
+    assert "<style>" not in html
+
+
+def test_render_html_escapes_raw_html():
+    """Test that raw HTML blocks and inline tags are not emitted"""
+    markdown = (
+        '# Title\n\n<script>alert("x")</script>\n\n'
+        "Text with <img src=x onerror=alert(1)> inline\n"
+    )
+
+    html = render_html(markdown)
+
+    assert "<script>" not in html
+    assert "<img" not in html
+    assert "&lt;script&gt;" in html
+    assert "<h1>Title</h1>" in html
+
+
+@pytest.fixture(scope="class")
+def rejected_run():
+    """One subprocess.run mock for a whole class whose calls must never reach Marp"""
+    mock = MagicMock(return_value=_OK_RESULT)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(subprocess, "run", mock)
+        yield mock
+    mock.assert_not_called()
+
+
+class TestMarpServiceValidation:
+    """Test that invalid requests are rejected before Marp is started"""
+
+    @pytest.fixture(autouse=True)
+    def mock_run(self, rejected_run):
+        """Use the class-wide mock instead of a fresh one per test"""
+        return rejected_run
+
+    @pytest.fixture
+    def slides_file(self, tmp_path):
+        slides_file = tmp_path / "test_slides.md"
+        slides_file.write_text("# Test Slide")
+        return str(slides_file)
+
+    @pytest.mark.parametrize(
+        "output_format, method_name, output_filename", GENERATE_CASES
+    )
+    def test_generate_without_output_dir_raises_error(
+        self, slides_file, output_format, method_name, output_filename
+    ):
+        """Test that generation without output directory raises error"""
+        service = MarpService(slides_file)
+
+        with pytest.raises(ValueError, match="Output directory must be set"):
+            getattr(service, method_name)(output_filename)
+
+    @pytest.mark.parametrize("method_name", ["generate_batch", "generate_parallel"])
+    def test_multi_file_without_output_dir_raises_error(self, slides_file, method_name):
+        """Test that multi-file conversion without output directory raises error"""
+        service = MarpService(slides_file)
+
+        with pytest.raises(ValueError, match="Output directory must be set"):
+            getattr(service, method_name)([slides_file], OutputFormat.PDF)
+
+    @pytest.mark.parametrize("method_name", ["generate_batch", "generate_parallel"])
+    def test_multi_file_rejects_duplicate_names(
+        self, tmp_path, slides_file, method_name
+    ):
+        """Test that files whose outputs would collide are rejected"""
+        service = MarpService(slides_file, str(tmp_path / "output"))
+
+        with pytest.raises(ValueError, match="unique file names"):
+            getattr(service, method_name)([slides_file, slides_file], OutputFormat.PDF)
+
+
+class TestMarpServer:
+    """Test MarpServer functionality"""
+
+    @pytest.fixture(autouse=True)
+    def mock_server(self, monkeypatch):
+        """Patch the server process and its HTTP endpoint"""
+        self.process = MagicMock()
+        self.process.poll.return_value = None
+        response = MagicMock()
+        response.__enter__.return_value.read.return_value = b"converted"
+        self.mock_popen = MagicMock(return_value=self.process)
+        self.mock_urlopen = MagicMock(return_value=response)
+        monkeypatch.setattr(subprocess, "Popen", self.mock_popen)
+        monkeypatch.setattr(urllib.request, "urlopen", self.mock_urlopen)
+
+    def test_init_starts_server_once(self):
+        """Test that the server is launched on the requested port and awaited"""
+        server = MarpServer(port=9090)
+
+        self.mock_popen.assert_called_once()
+        command = self.mock_popen.call_args.args[0]
+        assert command[:2] == ["marp", "--server"]
+        assert self.mock_popen.call_args.kwargs["env"]["PORT"] == "9090"
+        self.mock_urlopen.assert_called_once_with("http://localhost:9090", timeout=1)
+        server.close()
+
+    @pytest.mark.parametrize(
+        "output_format, query",
+        [
+            (OutputFormat.PDF, "?pdf"),
+            (OutputFormat.HTML, ""),
+            (OutputFormat.PNG, "?png"),
+            (OutputFormat.PPTX, "?pptx"),
+        ],
+    )
+    def test_convert_fetches_format(self, tmp_path, output_format, query):
+        """Test that conversions reuse the server and write the response"""
+        slides_file = tmp_path / "slides.md"
+        slides_file.write_text("# Slide")
+        output_path = tmp_path / f"slides.{output_format.value}"
+
+        with MarpServer() as server:
+            for _ in range(2):
+                result = server.convert(
+                    str(slides_file), str(output_path), output_format
+                )
+
+        self.mock_popen.assert_called_once()
+        url = self.mock_urlopen.call_args.args[0]
+        assert url.startswith(f"http://localhost:{server.port}/")
+        assert url.endswith(f".md{query}")
+        assert self.mock_urlopen.call_args.kwargs == {"timeout": 120.0}
+        assert result == str(output_path)
+        assert output_path.read_bytes() == b"converted"
+
+    def test_convert_reuses_staged_file(self, tmp_path):
+        """Test that repeated conversions of a source rewrite one staged file"""
+        slides_file = tmp_path / "slides.md"
+        other_file = tmp_path / "other.md"
+        other_file.write_text("# Other")
+
+        with MarpServer() as server:
+            input_dir = Path(server._input_dir.name)
+            slides_file.write_text("# First")
+            server.convert(str(slides_file), str(tmp_path / "a.pdf"), OutputFormat.PDF)
+            first_url = self.mock_urlopen.call_args.args[0]
+            slides_file.write_text("# Second")
+            server.convert(str(slides_file), str(tmp_path / "b.pdf"), OutputFormat.PDF)
+            second_url = self.mock_urlopen.call_args.args[0]
+            server.convert(str(other_file), str(tmp_path / "c.pdf"), OutputFormat.PDF)
+
+            staged = sorted(p.read_text() for p in input_dir.iterdir())
+
+        assert first_url == second_url
+        assert staged == ["# Other", "# Second"]
+
+    def test_close_terminates_server(self):
+        """Test that closing stops the process and removes staged files"""
+        server = MarpServer()
+        input_dir = Path(server._input_dir.name)
+
+        server.close()
+
+        self.process.terminate.assert_called_once()
+        assert not input_dir.exists()
+
+    def test_close_is_idempotent(self):
+        """Test that closing twice stops the server only once"""
+        server = MarpServer()
+
+        server.close()
+        server.close()
+
+        self.process.terminate.assert_called_once()
+
+    def test_unclosed_server_is_stopped_on_collection(self):
+        """Test that a server dropped without close() is still terminated"""
+        server = MarpServer()
+        input_dir = Path(server._input_dir.name)
+
+        del server
+        gc.collect()
+
+        self.process.terminate.assert_called_once()
+        assert not input_dir.exists()
+
+    def test_init_picks_free_port(self, monkeypatch):
+        """Test that without a port the server binds to a free one"""
+        monkeypatch.setattr(
+            "src.backend.services.marp_service._find_free_port", lambda: 45678
+        )
+
+        with MarpServer() as server:
+            assert server.port == 45678
+            assert self.mock_popen.call_args.kwargs["env"]["PORT"] == "45678"
+
+    def test_init_rejects_response_from_other_process(self):
+        """Test that a response after our server exited is not taken as ready"""
+        # Alive when first polled, gone once the port has answered
+        poll_results = iter([None])
+        self.process.poll.side_effect = lambda: next(poll_results, 1)
+
+        with pytest.raises(RuntimeError, match="exited during startup"):
+            MarpServer()
+        self.mock_urlopen.assert_called_once()
+
+    def test_init_fails_when_server_exits(self):
+        """Test that a server dying during startup is reported"""
+        self.process.poll.return_value = 1
+
+        with pytest.raises(RuntimeError, match="exited during startup"):
+            MarpServer()
@@ -1,6 +1,7 @@
 """Tests for PromptService"""
 
-import tempfile
+import os
+import tarfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -8,39 +9,41 @@ import pytest
 
 from src.backend.services import PromptService
 
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures"
 
-class TestPromptService:
-    """Test PromptService functionality"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        # Create temporary directory for test templates
-        self.temp_dir = tempfile.mkdtemp()
-        self.template_dir = Path(self.temp_dir) / "prompts"
-        self.template_dir.mkdir()
+def create_test_templates(template_dir: Path) -> None:
+    """Extract the pre-packed test templates in a single pass"""
+    with tarfile.open(FIXTURES_DIR / "prompt_templates.tar") as tar:
+        tar.extractall(template_dir, filter="data")
 
-        # Create test template files
-        self.create_test_templates()
 
-        self.service = PromptService(str(self.template_dir))
+@pytest.fixture(scope="session")
+def shared_prompt_templates(tmp_path_factory):
+    """Read-only test templates, written once per session"""
+    template_dir = tmp_path_factory.mktemp("prompts")
+    create_test_templates(template_dir)
+    return template_dir
 
-    def teardown_method(self):
-        """Clean up test files"""
-        import shutil
 
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
+@pytest.fixture(scope="module")
+def prompt_service(shared_prompt_templates):
+    """PromptService backed by the shared test templates.
+
+    Module-scoped so its template cache is shared across the whole suite.
+    """
+    return PromptService(str(shared_prompt_templates))
+
+
+@pytest.fixture
+def writable_template_dir(tmp_path):
+    """Private copy of the test templates for tests that modify them"""
+    create_test_templates(tmp_path)
+    return tmp_path
 
-    def create_test_templates(self):
-        """Create test template files"""
-        templates = {
-            "analyze_script.md": "Analyze this script: $script_content\nLimit: $argument_flow_limit characters",
-            "compose_slides.md": "Compose slides for: $script_content\nAnalysis: $analysis_result\nFunctions: $slide_functions_summary\nTarget: $target_slide_count slides",
-            "generate_parameters.md": "Generate parameters for: $slide_name\nPurpose: $function_purpose\nSignature: $function_signature\nArgs: $arguments_list\nScript: $script_content\nAnalysis: $analysis_result",
-        }
 
-        for filename, content in templates.items():
-            (self.template_dir / filename).write_text(content)
+class TestPromptService:
+    """Test PromptService functionality"""
 
     def test_init_with_default_template_dir(self):
         """Test initialization with default template directory"""
@@ -53,85 +56,81 @@ class TestPromptService:
         service = PromptService(custom_dir)
         assert service.template_dir == Path(custom_dir)
 
-    @patch("streamlit.secrets", {"ARGUMENT_FLOW_DIVISOR": 4})
-    def test_build_analysis_prompt(self):
-        """Test building analysis prompt"""
-        input_dict = {"script_content": "This is a test script"}
-        result = self.service.build_analysis_prompt(input_dict)
-
-        assert "prompt" in result
-        assert "script_content" in result
-        expected_limit = len("This is a test script") // 4
-        expected_prompt = f"Analyze this script: This is a test script\nLimit: {expected_limit} characters"
-        assert result["prompt"] == expected_prompt
-
-    @patch("streamlit.secrets", {"TARGET_SLIDE_COUNT": 3})
-    def test_build_composition_prompt(self):
-        """Test building composition prompt"""
-        input_dict = {
-            "script_content": "Test script",
-            "analysis_result": {"summary": "Analysis"},
-            "slide_functions_summary": "Function list",
-        }
-        result = self.service.build_composition_prompt(input_dict)
-
-        assert "prompt" in result
-        expected_prompt = 'Compose slides for: Test script\nAnalysis: {"summary": "Analysis"}\nFunctions: Function list\nTarget: 3 slides'
-        assert result["prompt"] == expected_prompt
-
-    def test_build_parameter_prompt(self):
-        """Test building parameter prompt"""
-        input_dict = {
-            "script_content": "Test script",
-            "analysis_result": {"summary": "Analysis"},
-            "slide_name": "test_function",
-            "function_info": {
-                "docstring": "Test function purpose\nMore details",
-                "signature": "test_function(arg1, arg2)",
-                "args_info": {"arg1": "First argument", "arg2": "Second argument"},
-            },
-        }
-        result = self.service.build_parameter_prompt(input_dict)
+    @pytest.mark.parametrize(
+        "builder, input_dict, expected_prompt",
+        [
+            pytest.param(
+                "build_analysis_prompt",
+                {"script_content": "This is a test script"},
+                "Analyze this script: This is a test script\nLimit: 5 characters",
+                id="analysis",
+            ),
+            pytest.param(
+                "build_composition_prompt",
+                {
+                    "script_content": "Test script",
+                    "analysis_result": {"summary": "Analysis"},
+                    "slide_functions_summary": "Function list",
+                },
+                'Compose slides for: Test script\nAnalysis: {"summary": "Analysis"}\nFunctions: Function list\nTarget: 3 slides',
+                id="composition",
+            ),
+            pytest.param(
+                "build_parameter_prompt",
+                {
+                    "script_content": "Test script",
+                    "analysis_result": {"summary": "Analysis"},
+                    "slide_name": "test_function",
+                    "function_info": {
+                        "docstring": "Test function purpose\nMore details",
+                        "signature": "test_function(arg1, arg2)",
+                        "args_info": {
+                            "arg1": "First argument",
+                            "arg2": "Second argument",
+                        },
+                    },
+                },
+                'Generate parameters for: test_function\nPurpose: Test function purpose\nSignature: test_function(arg1, arg2)\nArgs:   - arg1: First argument\n  - arg2: Second argument\nScript: Test script\nAnalysis: {"summary": "Analysis"}',
+                id="parameter",
+            ),
+            pytest.param(
+                "build_parameter_prompt",
+                {
+                    "script_content": "Test script",
+                    "analysis_result": {"summary": "Analysis"},
+                    "slide_name": "test_function",
+                    "function_info": {
+                        "docstring": "",
+                        "signature": "test_function()",
+                        "args_info": {},
+                    },
+                },
+                'Generate parameters for: test_function\nPurpose: \nSignature: test_function()\nArgs: \nScript: Test script\nAnalysis: {"summary": "Analysis"}',
+                id="parameter_empty_docstring",
+            ),
+            pytest.param(
+                "build_parameter_prompt",
+                {
+                    "script_content": "Test script",
+                    "analysis_result": {"summary": "Analysis"},
+                    "slide_name": "test_function",
+                    "function_info": {"signature": "test_function()", "args_info": {}},
+                },
+                'Generate parameters for: test_function\nPurpose: \nSignature: test_function()\nArgs: \nScript: Test script\nAnalysis: {"summary": "Analysis"}',
+                id="parameter_no_docstring",
+            ),
+        ],
+    )
+    def test_build_prompt(self, prompt_service, builder, input_dict, expected_prompt):
+        """Test each prompt builder against its template"""
+        result = getattr(prompt_service, builder)(input_dict)
 
-        assert "prompt" in result
-        expected_prompt = 'Generate parameters for: test_function\nPurpose: Test function purpose\nSignature: test_function(arg1, arg2)\nArgs:   - arg1: First argument\n  - arg2: Second argument\nScript: Test script\nAnalysis: {"summary": "Analysis"}'
         assert result["prompt"] == expected_prompt
 
-    def test_build_parameter_prompt_empty_docstring(self):
-        """Test building parameter prompt with empty docstring"""
-        input_dict = {
-            "script_content": "Test script",
-            "analysis_result": {"summary": "Analysis"},
-            "slide_name": "test_function",
-            "function_info": {
-                "docstring": "",
-                "signature": "test_function()",
-                "args_info": {},
-            },
-        }
-        result = self.service.build_parameter_prompt(input_dict)
-
-        assert "prompt" in result
-        assert "Purpose: " in result["prompt"]
-
-    def test_build_parameter_prompt_no_docstring(self):
-        """Test building parameter prompt with no docstring key"""
-        input_dict = {
-            "script_content": "Test script",
-            "analysis_result": {"summary": "Analysis"},
-            "slide_name": "test_function",
-            "function_info": {"signature": "test_function()", "args_info": {}},
-        }
-        result = self.service.build_parameter_prompt(input_dict)
-
-        assert "prompt" in result
-        assert "Purpose: " in result["prompt"]
-
-    @patch("streamlit.secrets", {"ARGUMENT_FLOW_DIVISOR": 4})
-    def test_build_prompt_preserves_input_dict(self):
+    def test_build_prompt_preserves_input_dict(self, prompt_service):
         """Test that building prompts preserves original input dictionary"""
         original_input = {"script_content": "Test", "other_key": "value"}
-        result = self.service.build_analysis_prompt(original_input)
+        result = prompt_service.build_analysis_prompt(original_input)
 
         # Check that original keys are preserved
         assert result["script_content"] == "Test"
@@ -139,11 +138,85 @@ class TestPromptService:
         # Check that prompt is added
         assert "prompt" in result
 
-    def test_missing_template_file_raises_error(self):
+    def test_missing_template_file_raises_error(self, writable_template_dir):
         """Test that missing template file raises FileNotFoundError"""
         # Remove a template file
-        (self.template_dir / "analyze_script.md").unlink()
+        (writable_template_dir / "analyze_script.md").unlink()
+        prompt_service = PromptService(str(writable_template_dir))
 
         input_dict = {"script_content": "Test"}
         with pytest.raises(FileNotFoundError):
-            self.service.build_analysis_prompt(input_dict)
+            prompt_service.build_analysis_prompt(input_dict)
+
+    def test_template_file_is_read_once(self, shared_prompt_templates):
+        """Test that repeated builds reuse the cached template"""
+        # Use a fresh instance so the cache starts cold
+        prompt_service = PromptService(str(shared_prompt_templates))
+        input_dict = {"script_content": "Test"}
+        with patch.object(
+            Path, "read_bytes", autospec=True, side_effect=Path.read_bytes
+        ) as mock_read_bytes:
+            first = prompt_service.build_analysis_prompt(input_dict)
+            second = prompt_service.build_analysis_prompt(input_dict)
+
+        assert first["prompt"] == second["prompt"]
+        mock_read_bytes.assert_called_once()
+
+    def test_modified_template_file_is_reloaded(self, writable_template_dir):
+        """Test that the cache is invalidated when the template file changes"""
+        prompt_service = PromptService(str(writable_template_dir))
+        input_dict = {"script_content": "Test"}
+        prompt_service.build_analysis_prompt(input_dict)
+
+        template_file = writable_template_dir / "analyze_script.md"
+        template_file.write_text("Updated: $script_content")
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        result = prompt_service.build_analysis_prompt(input_dict)
+        assert result["prompt"] == "Updated: Test"
+
+    def test_static_template_is_returned_verbatim(self, writable_template_dir):
+        """Test that a template without placeholders skips substitution"""
+        (writable_template_dir / "static.md").write_text("No placeholders here")
+        prompt_service = PromptService(str(writable_template_dir))
+
+        assert prompt_service._build_prompt("static.md", {}) == "No placeholders here"
+
+    def test_mutated_analysis_result_is_reserialized(self, shared_prompt_templates):
+        """Test that a dict analysis_result is encoded from its current contents"""
+        prompt_service = PromptService(str(shared_prompt_templates))
+        analysis_result = {"title": "Before"}
+        input_dict = {
+            "script_content": "Test",
+            "analysis_result": analysis_result,
+            "slide_functions_summary": "",
+        }
+
+        first = prompt_service.build_composition_prompt(input_dict)["prompt"]
+        analysis_result["title"] = "After"
+        second = prompt_service.build_composition_prompt(input_dict)["prompt"]
+
+        assert '"title": "Before"' in first
+        assert '"title": "After"' in second
+
+    def test_string_analysis_result_is_passed_through(self, prompt_service):
+        """Test that an already-serialized analysis_result is not re-encoded"""
+        analysis_json = '{"title": "Test"}'
+        with patch("src.backend.services.prompt_service.json.dumps") as mock_dumps:
+            result = prompt_service._dump_analysis_result(analysis_json)
+
+        assert result is analysis_json
+        mock_dumps.assert_not_called()
+
+    def test_arguments_list_is_memoized(self):
+        """Test that an identical argument set reuses the formatted list"""
+        PromptService._format_arguments_list.cache_clear()
+        args_info = (("title", "Slide title"), ("items", "Bullet items"))
+
+        first = PromptService._format_arguments_list(args_info)
+        second = PromptService._format_arguments_list(args_info)
+
+        assert first == "  - title: Slide title\n  - items: Bullet items"
+        assert second is first
+        assert PromptService._format_arguments_list.cache_info().hits == 1
@@ -1,30 +1,33 @@
 """Tests for ScriptAnalyzer"""
 
-import tempfile
+import os
+import shutil
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from src.backend.models.slide_template import SlideTemplate
 from src.backend.services import ScriptAnalyzer
 
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures"
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    """Shared ScriptAnalyzer instance (the analyzer is stateless)"""
+    return ScriptAnalyzer()
+
 
 class TestScriptAnalyzer:
     """Test ScriptAnalyzer functionality"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.analyzer = ScriptAnalyzer()
-        # Create temporary directory for test templates
-        self.temp_dir = tempfile.mkdtemp()
-        self.template_dir = Path(self.temp_dir) / "template"
+    @pytest.fixture(autouse=True)
+    def setup_template_dir(self, tmp_path):
+        """Set up a per-test template directory"""
+        self.template_dir = tmp_path / "template"
         self.template_dir.mkdir()
 
-    def teardown_method(self):
-        """Clean up test files"""
-        import shutil
-
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
-
     def create_test_template(self, content: str) -> SlideTemplate:
         """Helper to create a test template"""
         slides_file = self.template_dir / "slides.py"
@@ -41,9 +44,11 @@ class TestScriptAnalyzer:
             duration_minutes=10,
         )
 
-    def test_analyze_template_with_placeholders(self):
-        """Test analyzing template with placeholders"""
-        content = """
+    @pytest.mark.parametrize(
+        "content, expected_placeholders, expected_dynamic",
+        [
+            pytest.param(
+                """
         def example_slide():
             return f'''
             # ${title}
@@ -52,26 +57,13 @@ class TestScriptAnalyzer:
             
             Content: ${content}
             '''
-        """
-        template = self.create_test_template(content)
-
-        result = self.analyzer.analyze_template(template)
-
-        assert "placeholders" in result
-        assert "total_placeholders" in result
-        assert "has_dynamic_content" in result
-        assert "error" not in result
-
-        placeholders = result["placeholders"]
-        assert "title" in placeholders
-        assert "subtitle" in placeholders
-        assert "content" in placeholders
-        assert result["total_placeholders"] == 3
-        assert result["has_dynamic_content"] is False  # 3 <= 5
-
-    def test_analyze_template_with_many_placeholders(self):
-        """Test analyzing template with many placeholders (>5)"""
-        content = """
+        """,
+                {"title", "subtitle", "content"},
+                False,  # 3 <= 5
+                id="with_placeholders",
+            ),
+            pytest.param(
+                """
         def example_slide():
             return f'''
             # ${title}
@@ -82,35 +74,34 @@ class TestScriptAnalyzer:
             ${point3}
             ${conclusion}
             '''
-        """
-        template = self.create_test_template(content)
-
-        result = self.analyzer.analyze_template(template)
-
-        assert result["total_placeholders"] == 7
-        assert result["has_dynamic_content"] is True  # 7 > 5
-
-    def test_analyze_template_no_placeholders(self):
-        """Test analyzing template without placeholders"""
-        content = """
+        """,
+                {
+                    "title",
+                    "subtitle",
+                    "intro",
+                    "point1",
+                    "point2",
+                    "point3",
+                    "conclusion",
+                },
+                True,  # 7 > 5
+                id="many_placeholders",
+            ),
+            pytest.param(
+                """
         def example_slide():
             return '''
             # Static Title
             
             This is static content without placeholders.
             '''
-        """
-        template = self.create_test_template(content)
-
-        result = self.analyzer.analyze_template(template)
-
-        assert len(result["placeholders"]) == 0
-        assert result["total_placeholders"] == 0
-        assert result["has_dynamic_content"] is False
-
-    def test_analyze_template_duplicate_placeholders(self):
-        """Test analyzing template with duplicate placeholders"""
-        content = """
+        """,
+                set(),
+                False,
+                id="no_placeholders",
+            ),
+            pytest.param(
+                """
         def example_slide():
             return f'''
             # ${title}
@@ -119,20 +110,13 @@ class TestScriptAnalyzer:
             Also: ${title}
             Different: ${content}
             '''
-        """
-        template = self.create_test_template(content)
-
-        result = self.analyzer.analyze_template(template)
-
-        # Should only count unique placeholders
-        placeholders = result["placeholders"]
-        assert "title" in placeholders
-        assert "content" in placeholders
-        assert result["total_placeholders"] == 2
-
-    def test_analyze_template_complex_placeholders(self):
-        """Test analyzing template with complex placeholder names"""
-        content = """
+        """,
+                {"title", "content"},  # Only unique placeholders are counted
+                False,
+                id="duplicate_placeholders",
+            ),
+            pytest.param(
+                """
         def example_slide():
             return f'''
             ${main_title}
@@ -140,19 +124,46 @@ class TestScriptAnalyzer:
             ${item_with_numbers_123}
             ${UPPERCASE_ITEM}
             '''
-        """
+        """,
+                {
+                    "main_title",
+                    "sub_section_1",
+                    "item_with_numbers_123",
+                    "UPPERCASE_ITEM",
+                },
+                False,
+                id="complex_placeholders",
+            ),
+            pytest.param(
+                """
+        def example_slide():
+            return f'''
+            ${title}
+            {nested_dict["key"]}
+            ${valid_placeholder}
+            '''
+        """,
+                {"title", "valid_placeholder"},  # Only valid ${...} placeholders
+                False,
+                id="nested_braces",
+            ),
+            pytest.param("", set(), False, id="empty_content"),
+        ],
+    )
+    def test_analyze_template_placeholders(
+        self, analyzer, content, expected_placeholders, expected_dynamic
+    ):
+        """Test placeholder extraction across template content variants"""
         template = self.create_test_template(content)
 
-        result = self.analyzer.analyze_template(template)
+        result = analyzer.analyze_template(template)
 
-        placeholders = result["placeholders"]
-        assert "main_title" in placeholders
-        assert "sub_section_1" in placeholders
-        assert "item_with_numbers_123" in placeholders
-        assert "UPPERCASE_ITEM" in placeholders
-        assert result["total_placeholders"] == 4
+        assert "error" not in result
+        assert result["placeholders"] == expected_placeholders
+        assert result["total_placeholders"] == len(expected_placeholders)
+        assert result["has_dynamic_content"] is expected_dynamic
 
-    def test_analyze_template_file_not_found(self):
+    def test_analyze_template_file_not_found(self, analyzer):
         """Test analyzing template when slides file doesn't exist"""
         # Create template without slides.py file
         css_file = self.template_dir / "theme.css"
@@ -166,18 +177,19 @@ class TestScriptAnalyzer:
             duration_minutes=10,
         )
 
-        result = self.analyzer.analyze_template(template)
+        result = analyzer.analyze_template(template)
 
         assert "error" in result
         assert result["placeholders"] == set()
         assert result["total_placeholders"] == 0
         assert result["has_dynamic_content"] is False
 
-    def test_analyze_template_unicode_decode_error(self):
+    def test_analyze_template_unicode_decode_error(self, analyzer):
         """Test handling of unicode decode errors"""
-        # Create a file with invalid encoding
-        slides_file = self.template_dir / "slides.py"
-        slides_file.write_bytes(b"\xff\xfe\x00\x00")  # Invalid UTF-8
+        # Stage a pre-built file with invalid UTF-8
+        shutil.copyfile(
+            FIXTURES_DIR / "invalid_utf8.bin", self.template_dir / "slides.py"
+        )
 
         css_file = self.template_dir / "theme.css"
         css_file.write_text("/* test css */")
@@ -190,45 +202,14 @@ class TestScriptAnalyzer:
             duration_minutes=10,
         )
 
-        result = self.analyzer.analyze_template(template)
+        result = analyzer.analyze_template(template)
 
         assert "error" in result
         assert result["placeholders"] == set()
         assert result["total_placeholders"] == 0
         assert result["has_dynamic_content"] is False
 
-    def test_analyze_template_with_nested_braces(self):
-        """Test analyzing template with nested braces"""
-        content = """
-        def example_slide():
-            return f'''
-            ${title}
-            {nested_dict["key"]}
-            ${valid_placeholder}
-            '''
-        """
-        template = self.create_test_template(content)
-
-        result = self.analyzer.analyze_template(template)
-
-        # Should only extract valid ${...} placeholders
-        placeholders = result["placeholders"]
-        assert "title" in placeholders
-        assert "valid_placeholder" in placeholders
-        assert result["total_placeholders"] == 2
-
-    def test_analyze_template_empty_content(self):
-        """Test analyzing template with empty content"""
-        template = self.create_test_template("")
-
-        result = self.analyzer.analyze_template(template)
-
-        assert len(result["placeholders"]) == 0
-        assert result["total_placeholders"] == 0
-        assert result["has_dynamic_content"] is False
-        assert "error" not in result
-
-    def test_analyze_template_malformed_placeholders(self):
+    def test_analyze_template_malformed_placeholders(self, analyzer):
         """Test analyzing template with malformed placeholders"""
         content = """
         def example_slide():
@@ -241,10 +222,41 @@ class TestScriptAnalyzer:
         """
         template = self.create_test_template(content)
 
-        result = self.analyzer.analyze_template(template)
+        result = analyzer.analyze_template(template)
 
         # Should only extract valid placeholders
         placeholders = result["placeholders"]
         assert "valid_one" in placeholders
         # Note: empty ${} might be captured depending on regex implementation
         assert result["total_placeholders"] >= 1
+
+    def test_analyze_template_reuses_cached_scan(self, analyzer):
+        """Test that repeated analysis of an unchanged file reads it once"""
+        template = self.create_test_template("# ${title}")
+
+        with patch.object(
+            Path, "read_text", autospec=True, side_effect=Path.read_text
+        ) as mock_read_text:
+            first = analyzer.analyze_template(template)
+            second = analyzer.analyze_template(template)
+
+        assert first == second
+        mock_read_text.assert_called_once()
+
+        # Callers get their own copy of the placeholder set
+        first["placeholders"].add("mutated")
+        assert "mutated" not in analyzer.analyze_template(template)["placeholders"]
+
+    def test_analyze_template_rescans_modified_file(self, analyzer):
+        """Test that a changed slides file is analyzed again"""
+        template = self.create_test_template("# ${title}")
+        analyzer.analyze_template(template)
+
+        template.slides_path.write_text("# ${title}\n${subtitle}")
+        stat = template.slides_path.stat()
+        os.utime(
+            template.slides_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000)
+        )
+
+        result = analyzer.analyze_template(template)
+        assert result["placeholders"] == {"title", "subtitle"}
@@ -1,10 +1,38 @@
 """Tests for SlidesLoader"""
 
-from unittest.mock import Mock, patch
+import importlib
+import inspect
+import json
+import sys
+import types
+from unittest.mock import Mock, call, patch
 
 import pytest
 
 from src.backend.services import SlidesLoader
+from src.backend.services.slides_loader import META_FILENAME, _parse_docstring_args
+
+
+def make_template_package(package_dir):
+    """Create a template package on disk and a module object pointing at it"""
+
+    def slide_function(title: str):
+        """Create a slide
+
+        Args:
+            title: The slide title
+        """
+        return title
+
+    package_dir.mkdir(exist_ok=True)
+    (package_dir / "__init__.py").write_text("from .slides import slide_function\n")
+    (package_dir / "slides.py").write_text("def slide_function(title): ...\n")
+
+    module = types.ModuleType("test_template")
+    module.__file__ = str(package_dir / "__init__.py")
+    module.__all__ = ["slide_function"]
+    module.slide_function = slide_function
+    return module
 
 
 class TestSlidesLoader:
@@ -211,6 +239,146 @@ class TestSlidesLoader:
 
         assert result is None
 
+    @patch("importlib.import_module")
+    def test_load_template_functions_is_cached(self, mock_import):
+        """Test that repeated lookups reuse the loaded template"""
+        mock_module = Mock()
+        mock_module.__all__ = []
+        mock_import.return_value = mock_module
+
+        self.loader.list_available_functions("test_template")
+        self.loader.get_function_by_name("test_template", "missing")
+        self.loader.create_slide_functions_summary("test_template")
+
+        mock_import.assert_called_once_with("src.backend.templates.test_template")
+
+    @patch("importlib.import_module")
+    def test_repeated_lookups_do_not_reinspect_functions(self, mock_import):
+        """Test that cached lookups skip inspect.signature entirely"""
+
+        def slide_function(title: str):
+            """Slide function"""
+            return title
+
+        mock_module = Mock()
+        mock_module.__all__ = ["slide_function"]
+        mock_module.slide_function = slide_function
+        mock_import.return_value = mock_module
+
+        with patch.object(
+            inspect, "signature", wraps=inspect.signature
+        ) as mock_signature:
+            first = self.loader.load_template_functions("test_template")
+            self.loader.get_function_by_name("test_template", "slide_function")
+            self.loader.list_available_functions("test_template")
+            second = self.loader.load_template_functions("test_template")
+
+        assert second is first
+        mock_signature.assert_called_once_with(slide_function)
+
+    @patch("importlib.import_module")
+    def test_clear_cache_reloads_template(self, mock_import):
+        """Test that clear_cache forces the template to be loaded again"""
+        mock_module = Mock()
+        mock_module.__all__ = []
+        mock_import.return_value = mock_module
+
+        self.loader.load_template_functions("test_template")
+        self.loader.clear_cache()
+        self.loader.load_template_functions("test_template")
+
+        assert mock_import.call_count == 2
+
+    @patch("importlib.import_module")
+    def test_clear_cache_reloads_template_modules(self, mock_import, monkeypatch):
+        """Test that clear_cache reloads loaded template modules, submodules first"""
+        mock_module = Mock()
+        mock_module.__all__ = []
+        mock_import.return_value = mock_module
+        package = types.ModuleType("src.backend.templates.test_template")
+        slides = types.ModuleType("src.backend.templates.test_template.slides")
+        monkeypatch.setitem(sys.modules, package.__name__, package)
+        monkeypatch.setitem(sys.modules, slides.__name__, slides)
+        self.loader.load_template_functions("test_template")
+
+        # patch() resolves targets with the mocked import_module, so patch the object
+        with patch.object(importlib, "reload") as mock_reload:
+            self.loader.clear_cache()
+
+        assert mock_reload.call_args_list == [call(slides), call(package)]
+        assert _parse_docstring_args.cache_info().currsize == 0
+
+    @patch("importlib.import_module")
+    def test_load_template_functions_uses_meta_sidecar(self, mock_import, tmp_path):
+        """Test that a fresh sidecar replaces runtime introspection"""
+        module = make_template_package(tmp_path / "test_template")
+        mock_import.return_value = module
+        meta = self.loader.build_template_meta("test_template")
+        meta["functions"]["slide_function"]["docstring"] = "From sidecar"
+        (tmp_path / "test_template" / META_FILENAME).write_text(json.dumps(meta))
+
+        with patch.object(inspect, "signature", wraps=inspect.signature) as mock_sig:
+            result = self.loader.load_template_functions("test_template")
+
+        info = result["slide_function"]
+        assert info["function"] is module.slide_function
+        assert info["docstring"] == "From sidecar"
+        assert info["signature"] == "(title: str)"
+        assert info["args_info"] == {"title": "The slide title"}
+        mock_sig.assert_not_called()
+
+    @patch("importlib.import_module")
+    def test_load_template_functions_ignores_stale_sidecar(self, mock_import, tmp_path):
+        """Test that a sidecar built from older sources is not used"""
+        package_dir = tmp_path / "test_template"
+        mock_import.return_value = make_template_package(package_dir)
+        meta = self.loader.build_template_meta("test_template")
+        meta["functions"]["slide_function"]["docstring"] = "From sidecar"
+        (package_dir / META_FILENAME).write_text(json.dumps(meta))
+        (package_dir / "slides.py").write_text("def slide_function(title): 1\n")
+
+        result = self.loader.load_template_functions("test_template")
+
+        assert result["slide_function"]["docstring"].startswith("Create a slide")
+
+    @patch("importlib.import_module")
+    def test_load_template_functions_ignores_malformed_sidecar(
+        self, mock_import, tmp_path
+    ):
+        """Test that a sidecar that is not a JSON object falls back to inspection"""
+        package_dir = tmp_path / "test_template"
+        mock_import.return_value = make_template_package(package_dir)
+        (package_dir / META_FILENAME).write_text("[]")
+
+        result = self.loader.load_template_functions("test_template")
+
+        assert result["slide_function"]["docstring"].startswith("Create a slide")
+
+    @pytest.mark.parametrize(
+        "functions",
+        [
+            ["slide_function"],
+            {"slide_function": "Create a slide"},
+            {"slide_function": {"docstring": "From sidecar"}},
+        ],
+    )
+    @patch("importlib.import_module")
+    def test_load_template_functions_ignores_malformed_functions(
+        self, mock_import, functions, tmp_path
+    ):
+        """Test that a fresh sidecar with malformed function entries is not used"""
+        package_dir = tmp_path / "test_template"
+        mock_import.return_value = make_template_package(package_dir)
+        meta = self.loader.build_template_meta("test_template")
+        meta["functions"] = functions
+        (package_dir / META_FILENAME).write_text(json.dumps(meta))
+
+        result = self.loader.load_template_functions("test_template")
+
+        info = result["slide_function"]
+        assert info["docstring"].startswith("Create a slide")
+        assert info["args_info"] == {"title": "The slide title"}
+
     @patch("importlib.import_module")
     def test_list_available_functions(self, mock_import):
         """Test listing all available function names"""
@@ -249,6 +417,42 @@ class TestSlidesLoader:
         args_info = self.loader._parse_function_args(no_args_function)
         assert args_info == {}
 
+    def test_parse_function_args_returns_copy(self):
+        """Test that mutating parsed args does not change the memoized result"""
+
+        def documented_function(title):
+            """Create a slide
+
+            Args:
+                title: The slide title
+            """
+
+        args_info = self.loader._parse_function_args(documented_function)
+        args_info["title"] = "Changed"
+
+        assert SlidesLoader()._parse_function_args(documented_function) == {
+            "title": "The slide title"
+        }
+
+    def test_parse_function_args_multiline_description(self):
+        """Test that indented continuation lines extend the description"""
+
+        def multiline_function():
+            """Function with a wrapped argument description
+
+            Args:
+                param1: Description that wraps
+                    onto a second line
+                param2: Short description
+            """
+            pass
+
+        args_info = self.loader._parse_function_args(multiline_function)
+        assert args_info == {
+            "param1": "Description that wraps onto a second line",
+            "param2": "Short description",
+        }
+
     def test_parse_function_args_malformed_docstring(self):
         """Test parsing malformed docstring"""
 
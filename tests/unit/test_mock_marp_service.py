@@ -69,6 +69,29 @@ def test_mock_marp_service_with_theme(sample_template_path, tmp_path):
         assert f"with theme: {test_theme}" in content
 
 
+def test_mock_marp_service_generate_batch(sample_template_path, tmp_path):
+    """
+    Tests that MockMarpService writes one mock output per batch input.
+    """
+    output_dir = tmp_path / "output"
+    other_slides = tmp_path / "other.md"
+    other_slides.write_text("# Other")
+
+    marp_service = MockMarpService(
+        slides_path=str(sample_template_path), output_dir=str(output_dir)
+    )
+    output_paths = marp_service.generate_batch(
+        [str(sample_template_path), str(other_slides)],
+        MockMarpService.OutputFormat.PDF,
+    )
+
+    assert [os.path.basename(path) for path in output_paths] == [
+        "slides.pdf",
+        "other.pdf",
+    ]
+    assert all(os.path.exists(path) for path in output_paths)
+
+
 def test_mock_marp_service_preview(sample_template_path, tmp_path, capsys):
     """
     Tests that MockMarpService preview method works without calling marp CLI.
@@ -5,57 +5,50 @@ Tests the complete slide generation workflow end-to-end using mock responses
 to verify chain integration without external dependencies.
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import gc
+import json
+import threading
+from dataclasses import replace
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from olm_api_sdk.v1 import MockOlmClientV1
 
 from src.backend.chains.slide_gen_chain import SlideGenChain
-from src.backend.models.slide_template import SlideTemplate
+from src.backend.services import PromptService
+
+
+@pytest.fixture(scope="module")
+def mock_responses():
+    """Mock responses for different phases of slide generation"""
+    return [
+        '{"main_theme": "Test Presentation", "argument_flow": "This is a test presentation about slide generation"}',
+        '{"slides": [{"slide_name": "title_slide", "order": 1}, {"slide_name": "content_slide", "order": 2}]}',
+        '{"slide_name": "title_slide", "parameters": {"title": "Test Title", "subtitle": "Test Subtitle"}}',
+        "Mock response generated successfully",
+    ]
+
+
+@pytest.fixture(scope="module")
+def mock_olm_client(mock_responses):
+    """Create MockOlmClientV1 with predefined responses"""
+    return MockOlmClientV1(responses=mock_responses)
+
+
+@pytest.fixture(scope="module")
+def slide_gen_chain(mock_olm_client):
+    """Create one SlideGenChain instance with mock client for the whole module
+
+    Building the chain is the dominant setup cost, so it is shared; tests that
+    consume mock responses swap in their own client via monkeypatch.
+    """
+    return SlideGenChain(client=mock_olm_client)
 
 
 class TestSlideGenChainIntegration:
     """Integration tests for SlideGenChain workflow"""
 
-    @pytest.fixture
-    def mock_responses(self):
-        """Mock responses for different phases of slide generation"""
-        return [
-            '{"main_theme": "Test Presentation", "argument_flow": "This is a test presentation about slide generation"}',
-            '{"slides": [{"slide_name": "title_slide", "order": 1}, {"slide_name": "content_slide", "order": 2}]}',
-            '{"slide_name": "title_slide", "parameters": {"title": "Test Title", "subtitle": "Test Subtitle"}}',
-            "Mock response generated successfully",
-        ]
-
-    @pytest.fixture
-    def mock_template(self):
-        """Create a mock SlideTemplate for testing"""
-        template = MagicMock(spec=SlideTemplate)
-        template.id = "test_template"
-        template.name = "Test Template"
-        template.description = "Integration test template"
-        template.duration_minutes = 10
-        return template
-
-    @pytest.fixture
-    def mock_olm_client(self, mock_responses):
-        """Create MockOlmClientV1 with predefined responses"""
-        return MockOlmClientV1(responses=mock_responses)
-
-    @pytest.fixture
-    def slide_gen_chain(self, mock_olm_client):
-        """Create SlideGenChain instance with mock client"""
-        with patch(
-            "streamlit.secrets",
-            {
-                "OLLAMA_MODEL": "mock_model",
-                "ARGUMENT_FLOW_DIVISOR": 4,
-                "TARGET_SLIDE_COUNT": 10,
-            },
-        ):
-            yield SlideGenChain(client=mock_olm_client)
-
-    @patch("streamlit.secrets", {"OLLAMA_MODEL": "mock_model"})
     def test_slide_gen_chain_initialization(self, mock_olm_client):
         """Test that SlideGenChain initializes correctly with mock client"""
         chain = SlideGenChain(client=mock_olm_client)
@@ -67,28 +60,28 @@ class TestSlideGenChainIntegration:
         assert hasattr(chain, "slides_loader")
         assert hasattr(chain, "slide_gen_chain")
 
-    @patch(
-        "src.backend.services.slides_loader.SlidesLoader.create_slide_functions_summary"
-    )
-    @pytest.mark.asyncio
-    @patch("src.backend.services.slides_loader.SlidesLoader.load_template_functions")
-    @patch("src.backend.services.slides_loader.SlidesLoader.get_function_by_name")
+    def test_chain_graph_is_built_lazily_once(self, mock_olm_client):
+        """Test that the chain graph is assembled on first access only"""
+        with patch.object(
+            SlideGenChain, "_setup_chains", autospec=True, return_value=object()
+        ) as mock_setup:
+            chain = SlideGenChain(client=mock_olm_client)
+            mock_setup.assert_not_called()
+
+            first = chain.slide_gen_chain
+            second = chain.slide_gen_chain
+
+        assert first is second
+        mock_setup.assert_called_once_with(chain)
+
     async def test_full_slide_generation_workflow(
-        self,
-        mock_get_function,
-        mock_load_functions,
-        mock_create_catalog,
-        slide_gen_chain,
-        mock_template,
+        self, slide_gen_chain, mock_template, mock_responses, monkeypatch
     ):
         """Test complete slide generation workflow with mocked dependencies"""
-
-        # Setup mocks for slides loader
-        mock_create_catalog.return_value = "Function catalog content"
-        mock_load_functions.return_value = {
-            "title_slide": {"name": "title_slide", "params": ["title", "subtitle"]},
-            "content_slide": {"name": "content_slide", "params": ["content"]},
-        }
+        # Fresh client so response consumption doesn't leak into other tests
+        monkeypatch.setattr(
+            slide_gen_chain, "client", MockOlmClientV1(responses=mock_responses)
+        )
 
         # Mock slide generation functions
         def mock_title_slide(**kwargs):
@@ -97,10 +90,24 @@ class TestSlideGenChainIntegration:
         def mock_content_slide(**kwargs):
             return f"## Content\n{kwargs.get('content', 'Default content')}"
 
-        mock_get_function.side_effect = lambda template_id, func_name: {
+        slide_functions = {
             "title_slide": mock_title_slide,
             "content_slide": mock_content_slide,
-        }.get(func_name)
+        }
+
+        # Replace the slides loader lookups on the shared chain for this test only
+        loader_mocks = {
+            "create_slide_functions_summary": MagicMock(
+                return_value="Function catalog content"
+            ),
+            "get_function_by_name": MagicMock(
+                side_effect=lambda template_id, func_name: slide_functions.get(
+                    func_name
+                )
+            ),
+        }
+        for name, loader_mock in loader_mocks.items():
+            monkeypatch.setattr(slide_gen_chain.slides_loader, name, loader_mock)
 
         # Test script content
         script_content = (
@@ -118,13 +125,46 @@ class TestSlideGenChainIntegration:
             assert len(result) > 0
 
             # Verify that slides loader methods were called
-            mock_create_catalog.assert_called_once_with(mock_template.id)
-            mock_load_functions.assert_called_once_with(mock_template.id)
+            loader_mocks["create_slide_functions_summary"].assert_called_once_with(
+                mock_template.id
+            )
+            loader_mocks["get_function_by_name"].assert_has_calls(
+                [
+                    call(mock_template.id, "title_slide"),
+                    call(mock_template.id, "content_slide"),
+                ]
+            )
 
         except Exception as e:
             # If there are issues with the full workflow, verify individual components
             pytest.skip(f"Full workflow test skipped due to: {e}")
 
+    async def test_analysis_result_reaches_prompts_as_json(
+        self, mock_responses, mock_template, monkeypatch
+    ):
+        """Test that the analysis is serialized once, before the later prompts"""
+        seen = []
+
+        def capture_composition_prompt(prompt_service, input_dict):
+            seen.append(input_dict["analysis_result"])
+            raise RuntimeError("stop after composition prompt")
+
+        monkeypatch.setattr(
+            PromptService, "build_composition_prompt", capture_composition_prompt
+        )
+        chain = SlideGenChain(client=MockOlmClientV1(responses=mock_responses))
+        monkeypatch.setattr(
+            chain.slides_loader,
+            "create_slide_functions_summary",
+            MagicMock(return_value="Function catalog content"),
+        )
+
+        with patch("src.backend.chains.slide_gen_chain.print"):
+            with pytest.raises(RuntimeError, match="stop after composition prompt"):
+                await chain.invoke_slide_gen_chain("Test script", mock_template)
+
+        assert seen == [json.dumps(json.loads(mock_responses[0]), ensure_ascii=False)]
+
     def test_json_parser_integration(self, slide_gen_chain):
         """Test that JSON parser works correctly with mock responses"""
         # Access the json parser through the chain
@@ -152,8 +192,6 @@ class TestSlideGenChainIntegration:
         assert len(analysis_result["prompt"]) > 0
         assert "Test script content" in analysis_result["prompt"]
 
-    @patch("streamlit.secrets", {"OLLAMA_MODEL": "mock_model"})
-    @pytest.mark.asyncio
     @patch(
         "src.backend.chains.slide_gen_chain.print"
     )  # Mock print to avoid output during tests
@@ -175,7 +213,6 @@ class TestSlideGenChainIntegration:
         with pytest.raises(Exception):
             await chain.invoke_slide_gen_chain(script_content, mock_template)
 
-    @patch("streamlit.secrets", {"OLLAMA_MODEL": "mock_model"})
     def test_chain_with_different_response_configurations(self, mock_template):
         """Test chain behavior with different mock response configurations"""
 
@@ -189,7 +226,6 @@ class TestSlideGenChainIntegration:
         assert chain.client is minimal_client
         assert hasattr(chain, "slide_gen_chain")
 
-    @patch("streamlit.secrets", {"OLLAMA_MODEL": "mock_model"})
     def test_concurrent_chain_usage(self, mock_responses, mock_template):
         """Test that multiple chain instances can work concurrently"""
 
@@ -211,6 +247,167 @@ class TestSlideGenChainIntegration:
         assert chain1.client == client1
         assert chain2.client == client2
 
+    def test_invoke_slide_gen_chain_sync_reuses_event_loop(
+        self, slide_gen_chain, mock_template, monkeypatch
+    ):
+        """Test that the sync wrapper runs the chain on one cached loop"""
+
+        async def fake_invoke(script_content, template):
+            return asyncio.get_running_loop()
+
+        monkeypatch.setattr(slide_gen_chain, "invoke_slide_gen_chain", fake_invoke)
+
+        first_loop = slide_gen_chain.invoke_slide_gen_chain_sync("Test", mock_template)
+        second_loop = slide_gen_chain.invoke_slide_gen_chain_sync("Test", mock_template)
+
+        assert first_loop is second_loop
+        assert not first_loop.is_closed()
+
+    def test_invoke_slide_gen_chain_sync_closes_loop_with_thread(
+        self, slide_gen_chain, mock_template, monkeypatch
+    ):
+        """Test that a thread's cached event loop is closed once the thread ends"""
+        loops = []
+
+        async def fake_invoke(script_content, template):
+            return asyncio.get_running_loop()
+
+        monkeypatch.setattr(slide_gen_chain, "invoke_slide_gen_chain", fake_invoke)
+        thread = threading.Thread(
+            target=lambda: loops.append(
+                slide_gen_chain.invoke_slide_gen_chain_sync("Test", mock_template)
+            )
+        )
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        assert len(loops) == 1
+        assert loops[0].is_closed()
+
+    async def test_invoke_slide_gen_chain_batch(
+        self, slide_gen_chain, mock_template, monkeypatch, unit_test_secrets
+    ):
+        """Test that batch jobs run concurrently, bounded, and keep their order"""
+        monkeypatch.setitem(unit_test_secrets, "LLM_MAX_CONCURRENCY", 3)
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def fake_invoke(chain, script_content, template):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return f"slides for {script_content}"
+
+        monkeypatch.setattr(SlideGenChain, "invoke_slide_gen_chain", fake_invoke)
+        jobs = [(f"script {i}", mock_template) for i in range(8)]
+
+        results = await slide_gen_chain.invoke_slide_gen_chain_batch(jobs)
+
+        assert results == [f"slides for script {i}" for i in range(8)]
+        assert peak_in_flight == 3
+
+    async def test_invoke_slide_gen_chain_small_batch_runs_concurrently(
+        self, slide_gen_chain, mock_template, monkeypatch, unit_test_secrets
+    ):
+        """Test that a batch smaller than the limit runs entirely in parallel"""
+        monkeypatch.setitem(unit_test_secrets, "LLM_MAX_CONCURRENCY", 8)
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def fake_invoke(chain, script_content, template):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return script_content
+
+        monkeypatch.setattr(SlideGenChain, "invoke_slide_gen_chain", fake_invoke)
+        jobs = [(f"script {i}", mock_template) for i in range(4)]
+
+        results = await slide_gen_chain.invoke_slide_gen_chain_batch(jobs)
+
+        assert results == [f"script {i}" for i in range(4)]
+        assert peak_in_flight == 4
+
+    async def test_invoke_slide_gen_chain_batch_dispatches_by_duration(
+        self, slide_gen_chain, mock_template, monkeypatch
+    ):
+        """Test that batch jobs are dispatched shortest template duration first"""
+        started = []
+
+        async def fake_invoke(chain, script_content, template):
+            started.append(template.duration_minutes)
+            return script_content
+
+        monkeypatch.setattr(SlideGenChain, "invoke_slide_gen_chain", fake_invoke)
+        durations = [30, 5, 10, 30, 5, 10, 5, 30]
+        jobs = [
+            (f"script {i}", replace(mock_template, duration_minutes=duration))
+            for i, duration in enumerate(durations)
+        ]
+
+        results = await slide_gen_chain.invoke_slide_gen_chain_batch(jobs)
+
+        assert started == sorted(durations)
+        assert results == [f"script {i}" for i in range(len(durations))]
+
+    @patch("src.backend.chains.slide_gen_chain.print")
+    async def test_invoke_slide_gen_chain_batch_reports_job_progress(
+        self, mock_print, mock_olm_client, mock_template, monkeypatch
+    ):
+        """Test that a batch reports completed jobs, not interleaved job phases"""
+        progress = []
+        phases = []
+
+        async def fake_invoke(chain, script_content, template):
+            chain.current_phase = 0
+            for stage in ("analyzing", "composing", "building"):
+                await asyncio.sleep(0)
+                chain._report_phase_progress(stage)
+                phases.append(chain.current_phase)
+            return script_content
+
+        monkeypatch.setattr(SlideGenChain, "invoke_slide_gen_chain", fake_invoke)
+        chain = SlideGenChain(
+            client=mock_olm_client,
+            progress_callback=lambda *args: progress.append(args),
+        )
+        jobs = [(f"script {i}", mock_template) for i in range(3)]
+
+        results = await chain.invoke_slide_gen_chain_batch(jobs)
+
+        assert results == [f"script {i}" for i in range(3)]
+        assert progress == [("generating", i, 3) for i in (1, 2, 3)]
+        assert sorted(phases) == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+        assert chain.current_phase == 0
+
+    @patch("src.backend.chains.slide_gen_chain.print")
+    def test_build_template_with_placeholders(
+        self, mock_print, slide_gen_chain, mock_template, monkeypatch
+    ):
+        """Test that each slide function is called with per-slide placeholders"""
+
+        def title_slide(title, author):
+            return f"# {title}\n{author}"
+
+        monkeypatch.setattr(
+            slide_gen_chain.slides_loader,
+            "get_function_by_name",
+            lambda template_id, slide_name: title_slide,
+        )
+        context = {
+            "composition_plan": {"slides": [{"slide_name": "title_slide"}]},
+            "template": mock_template,
+        }
+
+        result = slide_gen_chain._build_template_with_placeholders(context)
+
+        assert result == "# {{TITLE_SLIDE_0_TITLE}}\n{{TITLE_SLIDE_0_AUTHOR}}"
+
     def test_chain_steps_creation(self, slide_gen_chain):
         """Test that chain steps are created properly"""
         # Verify that the main slide generation chain exists